@@ -10,66 +10,1283 @@ __date__ = "11/25/25"
 __copyright__ = "Copyright (c) 2025 Claudia"
 __license__ = "Python"
 
-from typing import List
+from typing import Final, List, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 from jinja2 import Environment, FileSystemLoader
 
 import io
+import copy
 import re
 import json
-import zipfile
 import datetime
-import pandas as pd
+import functools
 import streamlit as st
-import plotly.express as px
 
+# pandas, plotly, zipfile and the optional holidays package are
+# imported where they are used (Gantt chart, ZIP export, holiday calendar)
+# so pages that never reach those sections don't pay their import cost.
 
-# Optional lightweight holiday support
+# Optional faster JSON decoding for uploaded exports and encoding for
+# downloads (both fall back to stdlib)
 try:
-    import holidays as _hol
+    import orjson as _orjson
+    from orjson import loads as _json_loads
 except Exception:  # pragma: no cover
-    _hol = None
+    _orjson = None
+    _json_loads = json.loads
+
+
+# Placeholder first option for radios that start unselected
+_SELECT_SENTINEL: Final[str] = "— Select one —"
+
+# My Role radio options (sentinel first, "Other (fill in)" last)
+_ROLE_WHO_OPTIONS: Final[Tuple[str, ...]] = (
+    _SELECT_SENTINEL,
+    "I’m a network engineer.",
+    "I’m a security engineer.",
+    "I’m a software developer.",
+    "I manage technical projects or teams.",
+    "Other (fill in)",
+)
+_ROLE_SKILL_OPTIONS: Final[Tuple[str, ...]] = (
+    _SELECT_SENTINEL,
+    "I have some scripting skills and basic software development experience.",
+    "I am an advanced software developer.",
+    "I provide techncial management on network and automation projects.",
+    "Other (fill in)",
+)
+_ROLE_DEV_OPTIONS: Final[Tuple[str, ...]] = (
+    _SELECT_SENTINEL,
+    "I’ll do it myself.",
+    "My in-house team and I will build it.",
+    "We will have outside experts build it, but I’ll provide technical oversight.",
+    "Other (fill in)",
+)
+# Checkbox option labels per wizard section
+_PRES_USER_OPTIONS: Final[Tuple[str, ...]] = (
+    "Network Engineers",
+    "IT",
+    "Operations",
+    "Help Desk",
+    "Other IT Organizations",
+    "Any User",
+    "Authorized Users",
+)
+_PRES_INTERACT_OPTIONS: Final[Tuple[str, ...]] = ("CLI", "Web GUI", "Other GUI", "API")
+_PRES_TOOL_OPTIONS: Final[Tuple[str, ...]] = (
+    "Python",
+    "Python Web Framework (Streamlit, Flask, etc.)",
+    "General Web Framework",
+    "Automation Framework",
+    "REST API",
+    "GraphQL API",
+    "Custom API",
+)
+_PRES_AUTH_OPTIONS: Final[Tuple[str, ...]] = (
+    "No Authentication (suitable only for demos and very specific use cases)",
+    "Repository authorization/sharing",
+    "Built-in (to the automation) Authentication via Username/Password or TOKEN",
+    "Custom Authentication to external system (AD, SSH Keys, OAUTH2)",
+)
+_INTENT_DEV_OPTIONS: Final[Tuple[str, ...]] = (
+    "Templates",
+    "Policies",
+    "Service Profiles",
+    "Model-driven (data models)",
+    "Declarative (YAML/JSON)",
+    "Forms/GUI",
+    "Domain-specific language (DSL)",
+    "GitOps workflow (PRs/Reviews)",
+    "API-driven",
+    "Import from Source of Truth (CMDB/IPAM/Inventory/Git)",
+)
+_INTENT_PROV_OPTIONS: Final[Tuple[str, ...]] = (
+    "Text file",
+    "Serialized format (JSON, YAML)",
+    "CSV",
+    "Excel",
+    "API",
+)
+_OBS_STATE_OPTIONS: Final[Tuple[str, ...]] = (
+    "Manual",
+    "Purpose-built Python Script",
+    "API call",
+)
+_OBS_TOOL_OPTIONS: Final[Tuple[str, ...]] = (
+    "SuzieQ Open Source",
+    "SuzieQ Enterprise",
+    "Network Vendor Product (Cisco Catalyst Center, Arista CVP, etc.)",
+    "Custom Python Scripts",
+)
+_ORCH_OPTIONS: Final[Tuple[str, ...]] = (
+    _SELECT_SENTINEL,
+    "No",
+    "Yes – internal via custom scripts and logic",
+    "Yes – provide details",
+)
+_COLLECTOR_METHOD_OPTIONS: Final[Tuple[str, ...]] = (
+    "SNMP",
+    "CLI/SSH",
+    "NETCONF",
+    "gNMI",
+    "REST API",
+    "Webhooks",
+    "Syslog",
+    "Streaming Telemetry",
+)
+_COLLECTOR_AUTH_OPTIONS: Final[Tuple[str, ...]] = (
+    "Username/Password",
+    "SSH Keys",
+    "OAuth2",
+    "API Token",
+    "mTLS",
+)
+_COLLECTOR_HANDLING_OPTIONS: Final[Tuple[str, ...]] = (
+    "None",
+    "Rate limiting",
+    "Retries",
+    "Exponential backoff",
+    "Buffering/Queue",
+)
+_COLLECTOR_NORM_OPTIONS: Final[Tuple[str, ...]] = (
+    "None",
+    "Timestamping",
+    "Tagging/labels",
+    "Topology enrichment",
+    "Schema mapping",
+)
+_COLLECTION_TOOL_OPTIONS: Final[Tuple[str, ...]] = (
+    "None",
+    "SuzieQ",
+    "Cisco Catalyst Center",
+    "Cisco Nexus Dashboard",
+    "Cisco ACI APIC",
+    "Arista CVP",
+    "Prometheus",
+)
+_EXEC_OPTIONS: Final[Tuple[str, ...]] = (
+    "Automating CLI interaction with Python automation frameworks (Netmiko, Napalm, Nornir, PyATS)",
+    "Automating execution with a tool like Ansible",
+    "Custom Python scripts",
+    "Via manufacturer management application (Cisco DNA Center, Arista CVP)",
+)
+# Dependency checkboxes: session key suffix, label, default, details input,
+# optional default detail text, help
+# (read-only views so the shared definitions cannot be mutated by a rerun)
+_DEP_DEFS = tuple(
+    MappingProxyType(d)
+    for d in (
+        {
+            "key": "network_infra",
+            "label": "Network Infrastructure",
+            "default": True,
+            "details": False,
+            "help": "The automation will act on some or all of the organization's network infrastructure (switches, appliances, routers, etc.).",
+        },
+        {
+            "key": "network_controllers",
+            "label": "Network Controllers",
+            "default": False,
+            "details": True,
+        },
+        {
+            "key": "revision_control",
+            "label": "Revision Control system",
+            "default": True,
+            "details": True,
+            "default_detail": "GitHub",
+            "help": "e.g. GitHub, GitLab, Bitbucket",
+        },
+        {
+            "key": "itsm",
+            "label": "ITSM/Change Management System",
+            "default": False,
+            "details": True,
+        },
+        {
+            "key": "authn",
+            "label": "Authentication System",
+            "default": False,
+            "details": True,
+        },
+        {
+            "key": "ipams",
+            "label": "IPAMS Systems",
+            "default": False,
+            "details": True,
+        },
+        {
+            "key": "inventory",
+            "label": "Inventory Systems",
+            "default": False,
+            "details": True,
+            "help": "Source of truth/CMDB/inventory (e.g., NetBox, InfraHub, ServiceNow CMDB). What data do you read/write?",
+        },
+        {
+            "key": "design_intent",
+            "label": "Design Data/Intent Systems",
+            "default": False,
+            "details": True,
+            "help": "Systems holding golden intent or design models (InfraHub, Custom DB).",
+        },
+        {
+            "key": "observability",
+            "label": "Observability System",
+            "default": False,
+            "details": True,
+            "help": "Telemetry/monitoring/logs/traces (e.g., SuzieQ, Prometheus).",
+        },
+        {
+            "key": "vendor_mgmt",
+            "label": "Vendor Tool/Management System",
+            "default": False,
+            "details": True,
+            "help": "(e.g., Cisco DNAC, Wireless Controllers, Miraki, Arista CVP, Aruba Central, Juniper Apstra).",
+        },
+    )
+)
+# Holiday calendars offered for business-day scheduling
+_HOLIDAY_REGIONS: Final[Tuple[str, ...]] = (
+    "None",
+    "United States",
+    "Canada",
+    "United Kingdom",
+    "Germany",
+    "India",
+    "Australia",
+)
+# holidays-package class name for each calendar region ("None" has no entry)
+_HOLIDAY_REGION_ATTRS = {
+    "United States": "UnitedStates",
+    "Canada": "Canada",
+    "United Kingdom": "UnitedKingdom",
+    "Germany": "Germany",
+    "India": "India",
+    "Australia": "Australia",
+}
+_ORCH_INDEX = {opt: i for i, opt in enumerate(_ORCH_OPTIONS)}
+# Fixed highlight sentence per orchestration choice ("Yes – provide details"
+# is built from the details text instead)
+_ORCH_SENTENCES = {
+    "No": "No Orchestration will be used in this project.",
+    "Yes – internal via custom scripts and logic": "Orchestration will be implemented internally using custom scripts and logic to coordinate end-to-end workflows.",
+}
+# Executor widget keys are positional (exec_<index>)
+_EXEC_OPTION_INDEX = {opt: i for i, opt in enumerate(_EXEC_OPTIONS)}
+# Dependency label -> (checkbox key, details key) for restoring uploads
+_DEP_STATE_KEYS = {
+    d["label"]: (f"dep_{d['key']}", f"dep_{d['key']}_details") for d in _DEP_DEFS
+}
+# (name, details) pairs of the pre-checked dependencies; a payload listing
+# exactly these carries no user-provided dependency content
+_DEFAULT_DEPS: Final[Tuple[Tuple[str, str], ...]] = tuple(
+    (d["label"], d.get("default_detail", "")) for d in _DEP_DEFS if d["default"]
+)
+_DEFAULT_DEPS_FSET = frozenset(_DEFAULT_DEPS)
+
+# Known option labels used when re-applying an uploaded wizard JSON, derived
+# from the widget options so the two cannot drift apart
+_KNOWN_WHO = frozenset(_ROLE_WHO_OPTIONS[1:-1])
+_KNOWN_SKILLS = frozenset(_ROLE_SKILL_OPTIONS[1:-1])
+_KNOWN_DEV_ROLE = frozenset(_ROLE_DEV_OPTIONS[1:-1])
+_KNOWN_INTERACT = frozenset(_PRES_INTERACT_OPTIONS)
+_KNOWN_PRES_TOOLS = frozenset(_PRES_TOOL_OPTIONS)
+_KNOWN_PRES_AUTH = frozenset(_PRES_AUTH_OPTIONS)
+_KNOWN_INTENT_DEV = frozenset(_INTENT_DEV_OPTIONS)
+_KNOWN_INTENT_PROV = frozenset(_INTENT_PROV_OPTIONS)
+_KNOWN_OBS_TOOLS = frozenset(_OBS_TOOL_OPTIONS)
+_KNOWN_COLLECTOR_METHODS = frozenset(_COLLECTOR_METHOD_OPTIONS)
+_KNOWN_COLLECTOR_AUTH = frozenset(_COLLECTOR_AUTH_OPTIONS)
+_KNOWN_COLLECTOR_HANDLING = frozenset(_COLLECTOR_HANDLING_OPTIONS)
+_KNOWN_COLLECTOR_NORM = frozenset(_COLLECTOR_NORM_OPTIONS)
+_KNOWN_COLLECTION_TOOLS = frozenset(_COLLECTION_TOOL_OPTIONS)
+
+# Session-state key prefixes cleared by "Reset to defaults". Passed as a tuple
+# to str.startswith so the prefix alternation runs in C.
+_RESET_PREFIXES = (
+    "pres_",
+    "intent_",
+    "obs_",
+    "orch_",
+    "collector_",
+    "collection_tool_",
+    "collection_tools_",
+    "exec_",
+    "my_role_",
+    "dep_",
+    "_timeline_",
+)
+# Overwrite-on-upload also clears the persisted initiative/widget keys
+_OVERWRITE_PREFIXES = _RESET_PREFIXES + ("_wizard_", "_widget_")
+# Checkbox/toggle key prefixes forced to False when a key survives the sweep
+_CHECKBOX_PREFIXES = (
+    "pres_user_",
+    "pres_interact_",
+    "pres_tool_",
+    "pres_auth_",
+    "intent_dev_",
+    "intent_prov_",
+    "obs_state_",
+    "obs_tool_",
+    "collector_method_",
+    "collector_auth_",
+    "collector_handle_",
+    "collector_norm_",
+    "collection_tool_",
+    "collection_tools_",
+)
+# "Other"/custom enable toggles turned off on reset
+_CUSTOM_ENABLE_KEYS = (
+    "pres_user_custom_enable",
+    "pres_interact_custom_enable",
+    "pres_tool_custom_enable",
+    "pres_auth_other_enable",
+    "intent_dev_custom_enable",
+    "intent_prov_custom_enable",
+    "obs_tool_other_enable",
+    "collector_methods_other_enable",
+    "collector_auth_other_enable",
+    "collector_handling_other_enable",
+    "collector_norm_other_enable",
+    "collection_tools_other_enable",
+)
+# Un-prefixed widget keys dropped on reset
+_RESET_POP_KEYS = (
+    "automation_title",
+    "automation_description",
+    "expected_use",
+    "out_of_scope",
+    "no_move_forward",
+    "no_move_forward_reasons",
+    "timeline_staff_count",
+    "timeline_staffing_plan",
+    "timeline_holiday_region",
+    "timeline_start_date",
+    "timeline_milestones",
+)
+# Initiative widget defaults (_wizard_ keys persist across pages)
+_INITIATIVE_DEFAULTS = {
+    "_wizard_automation_title": "My new network automation project",
+    "_wizard_automation_description": (
+        "Here is a short description of my my new network automation project"
+    ),
+    "_wizard_expected_use": (
+        "This automation will be used whenever this task needs to be executed. See Use Cases for more details."
+    ),
+    "_wizard_out_of_scope": "",
+}
+# Untouched initiative text; payloads still carrying these count as defaults
+_DEFAULT_TITLE: Final[str] = _INITIATIVE_DEFAULTS["_wizard_automation_title"]
+_DEFAULT_DESC: Final[str] = _INITIATIVE_DEFAULTS["_wizard_automation_description"]
+# Empty section shapes used to fill out the exported payload; copied before
+# use so the shared templates are never mutated
+_DEFAULT_SECTIONS = MappingProxyType(
+    {
+        "my_role": {"who": "", "skills": "", "developer": ""},
+        "presentation": {
+            "users": "",
+            "interaction": "",
+            "tools": "",
+            "auth": "",
+            "selections": {"users": [], "interactions": [], "tools": [], "auth": []},
+        },
+        "intent": {
+            "development": "",
+            "provided": "",
+            "selections": {"development": [], "provided": []},
+        },
+        "observability": {
+            "methods": "",
+            "go_no_go": "",
+            "additional_logic": "",
+            "tools": "",
+            "selections": {
+                "methods": [],
+                "go_no_go_text": "",
+                "additional_logic_enabled": False,
+                "additional_logic_text": "",
+                "tools": [],
+            },
+        },
+        "orchestration": {"summary": "", "selections": {"choice": "No", "details": ""}},
+        "executor": {"methods": "", "selections": {"methods": []}},
+        "collector": {
+            "methods": "",
+            "auth": "",
+            "handling": "",
+            "normalization": "",
+            "scale": "",
+            "tools": "",
+            "selections": {
+                "methods": [],
+                "auth": [],
+                "handling": [],
+                "normalization": [],
+                "devices": "",
+                "metrics_per_sec": "",
+                "cadence": "",
+                "tools": [],
+            },
+        },
+    }
+)
+# Standard reasons offered for not moving forward with the initiative
+_NO_MOVE_FORWARD_REASONS = (
+    "We are not improving the way our customers interact with us for service provisioning",
+    "We are not improving the speed and quality of our service provisioning",
+    "We are not meeting feature or service demands from our customers",
+    "We will continue to pay for 3rd party support for this task",
+    "This task will continue to be executed individually in an inconsistent and ad-hoc manner with varying degrees of success and documentation",
+    "This task will continue to take far longer than it should resulting in poor customer satisfaction",
+)
+# Values written after every reset: custom enable toggles off and My Role
+# radios on their sentinel
+_CLEARED_STATE = {
+    **dict.fromkeys(_CUSTOM_ENABLE_KEYS, False),
+    "my_role_who": _SELECT_SENTINEL,
+    "my_role_skills": _SELECT_SENTINEL,
+    "my_role_dev": _SELECT_SENTINEL,
+}
+# Defaults restored by "Reset to defaults" (not by Overwrite-on-upload)
+_RESET_DEFAULTS = {
+    # Minimal sane defaults
+    "dep_network_infra": True,
+    "dep_revision_control": True,
+    "dep_revision_control_details": "GitHub",
+    # Initiative defaults (use _wizard_ keys to persist across pages)
+    **_INITIATIVE_DEFAULTS,
+    "no_move_forward": "",
+    # Orchestration defaults so select resets visually
+    "orch_choice": _SELECT_SENTINEL,
+    "orch_details_text": "",
+}
+# Multi-select fields restored from an uploaded JSON:
+# (section, selections field, checkbox key prefix, known options or None to
+# accept any value, "other" enable key, "other" text key, join unknowns).
+# Unknown values enable the "other" input; it gets the last unknown value, or
+# all of them comma-joined when join is True.
+_MULTI_SELECT_SPECS = (
+    ("presentation", "users", "pres_user_", None, None, None, False),
+    (
+        "presentation",
+        "interactions",
+        "pres_interact_",
+        _KNOWN_INTERACT,
+        "pres_interact_custom_enable",
+        "pres_interact_custom",
+        False,
+    ),
+    (
+        "presentation",
+        "tools",
+        "pres_tool_",
+        _KNOWN_PRES_TOOLS,
+        "pres_tool_custom_enable",
+        "pres_tool_custom",
+        False,
+    ),
+    (
+        "presentation",
+        "auth",
+        "pres_auth_",
+        _KNOWN_PRES_AUTH,
+        "pres_auth_other_enable",
+        "pres_auth_other_text",
+        False,
+    ),
+    (
+        "intent",
+        "development",
+        "intent_dev_",
+        _KNOWN_INTENT_DEV,
+        "intent_dev_custom_enable",
+        "intent_dev_custom",
+        True,
+    ),
+    (
+        "intent",
+        "provided",
+        "intent_prov_",
+        _KNOWN_INTENT_PROV,
+        "intent_prov_custom_enable",
+        "intent_prov_custom",
+        True,
+    ),
+    ("observability", "methods", "obs_state_", None, None, None, False),
+    (
+        "observability",
+        "tools",
+        "obs_tool_",
+        _KNOWN_OBS_TOOLS,
+        "obs_tool_other_enable",
+        "obs_tool_other_text",
+        False,
+    ),
+    (
+        "collector",
+        "methods",
+        "collector_method_",
+        _KNOWN_COLLECTOR_METHODS,
+        "collector_methods_other_enable",
+        "collector_methods_other",
+        False,
+    ),
+    (
+        "collector",
+        "auth",
+        "collector_auth_",
+        _KNOWN_COLLECTOR_AUTH,
+        "collector_auth_other_enable",
+        "collector_auth_other",
+        False,
+    ),
+    (
+        "collector",
+        "handling",
+        "collector_handle_",
+        _KNOWN_COLLECTOR_HANDLING,
+        "collector_handling_other_enable",
+        "collector_handling_other",
+        False,
+    ),
+    (
+        "collector",
+        "normalization",
+        "collector_norm_",
+        _KNOWN_COLLECTOR_NORM,
+        "collector_norm_other_enable",
+        "collector_norm_other",
+        False,
+    ),
+    (
+        "collector",
+        "tools",
+        "collection_tool_",
+        _KNOWN_COLLECTION_TOOLS,
+        "collection_tools_other_enable",
+        "collection_tools_other",
+        False,
+    ),
+)
+
+
+# Jinja2 environment shared across reruns so compiled templates stay cached.
+# Output is Markdown, so autoescape stays off; templates ship with the app,
+# so skip the per-render mtime check.
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(
+        (Path(__file__).resolve().parent / "templates").as_posix()
+    ),
+    auto_reload=False,
+)
+
+# Summary sections the SDD template renders on its own; stripped from the
+# highlights block in a single pass so they are not duplicated
+_HL_STRIP_RE = re.compile(
+    r"(?ms)^##\s*(?:"
+    + "|".join(
+        re.escape(h)
+        for h in (
+            "Initiative",
+            "Presentation",
+            "Intent",
+            "Observability",
+            "Orchestration",
+            "Collector",
+            "Executor",
+            "Dependencies",
+            "Staffing, Timeline, & Milestones",
+            "Staffing Plan",
+        )
+    )
+    + r")\b.*?(?=^##\s|\Z)"
+)
 
 
-def hr_colors():
+# Runs of characters not allowed in export file names, plus runs of underscores,
+# so one substitution both replaces and collapses them
+_SANITIZE_RE = re.compile(r"(?:[^\w-]|_)+")
+# ASCII-only variant used for the minimal (orchestration-only) export name
+_TITLE_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+@functools.lru_cache(maxsize=1)
+def _holidays_module():
+    """Return the optional holidays module, importing it on first use (None if unavailable)."""
+    try:
+        import holidays
+    except Exception:  # pragma: no cover
+        return None
+    return holidays
+
+
+@functools.lru_cache(maxsize=64)
+def _build_holiday_set(region: str, start_year: int, years_ahead: int = 2) -> frozenset:
     """
-    Return the color palette used for horizontal rules and branding accents.
+    Return the weekday public holidays for a region as a frozenset of dates.
+
+    Cached per (region, start_year, years_ahead): constructing a holidays
+    calendar is the expensive part and the inputs rarely change between reruns.
+    Holidays falling on a weekend never move a business day, so they are
+    dropped here once instead of being re-checked for every milestone.
+
+    Parameters
+    - region: one of _HOLIDAY_REGIONS; "None" disables holidays
+    - start_year: first calendar year to include
+    - years_ahead: number of additional years to include (at least 1)
+
+    Returns
+    - frozenset of Mon–Fri datetime.date (empty when disabled or unavailable)
+    """
+    if region == "None":
+        return frozenset()
+    _hol = _holidays_module()
+    if _hol is None:
+        return frozenset()
+    years = list(range(start_year, start_year + max(1, years_ahead) + 1))
+    attr = _HOLIDAY_REGION_ATTRS.get(region)
+    cls = getattr(_hol, attr, None) if attr else None
+    try:
+        cal = cls(years=years) if cls else None
+    except Exception:
+        cal = None
+    if not cal:
+        return frozenset()
+    return frozenset(h for h in cal.keys() if h.weekday() < 5)
+
+
+def _add_weekdays(d: datetime.date, n: int) -> datetime.date:
+    """Return the n-th Mon–Fri day strictly after d (n >= 0), in constant time."""
+    wd = d.weekday()
+    if wd >= 5:  # a weekend start counts from the preceding Friday
+        d -= datetime.timedelta(days=wd - 4)
+        wd = 4
+    weeks, rem = divmod(n, 5)
+    extra = 2 if rem and wd + rem >= 5 else 0
+    return d + datetime.timedelta(days=weeks * 7 + rem + extra)
+
+
+def _add_business_days(d: datetime.date, n: int, holiday_set=frozenset()):
+    """
+    Add business days (Mon–Fri) to a date, skipping any weekday holidays.
+
+    Whole weeks are skipped arithmetically; only holidays that fall inside the
+    resulting window are walked, each pushing the end out by one business day.
+
+    Parameters
+    - d: start date (not itself counted)
+    - n: number of business days to add
+    - holiday_set: set of datetime.date to skip
+
+    Returns
+    - datetime.date of the n-th business day after d (d itself when n <= 0)
+    """
+    days = int(n or 0)
+    if days <= 0:
+        return d
+    cur = _add_weekdays(d, days)
+    lo = d
+    while holiday_set:
+        skipped = sum(1 for h in holiday_set if lo < h <= cur and h.weekday() < 5)
+        if not skipped:
+            break
+        lo, cur = cur, _add_weekdays(cur, skipped)
+    return cur
+
+
+@functools.lru_cache(maxsize=1)
+def _pandas_module():
+    """Return pandas, imported on first use by the timeline editor."""
+    import pandas as pd
+
+    return pd
+
+
+@functools.lru_cache(maxsize=1)
+def _plotting_modules():
+    """Return (plotly.graph_objects, Set3 palette), imported on first Gantt use."""
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+
+    return go, qualitative.Set3
+
+
+def _timeline_figure(names, starts, ends):
+    """
+    Build a Gantt-style figure from parallel task/start/finish sequences.
+
+    Draws horizontal bars with graph_objects directly (one trace and colour
+    per distinct task, like px.timeline with color="Task") without going
+    through a pandas DataFrame.
+
+    Parameters
+    - names: task labels
+    - starts, ends: ISO date strings or date objects
+
+    Returns
+    - plotly Figure
+    """
+    go, palette = _plotting_modules()
+    rows = {}
+    for name, start, end in zip(names, starts, ends):
+        s = datetime.datetime.fromisoformat(str(start))
+        e = datetime.datetime.fromisoformat(str(end))
+        rows.setdefault(name, []).append((s, e))
+    fig = go.Figure()
+    for i, (name, spans) in enumerate(rows.items()):
+        fig.add_trace(
+            go.Bar(
+                name=str(name),
+                legendgroup=str(name),
+                y=[name] * len(spans),
+                base=[s.isoformat() for s, _ in spans],
+                x=[(e - s).total_seconds() * 1000 for s, e in spans],
+                customdata=[e.isoformat() for _, e in spans],
+                orientation="h",
+                marker_color=palette[i % len(palette)],
+                hovertemplate=(
+                    "Task=%{y}<br>Start=%{base}<br>Finish=%{customdata}<extra></extra>"
+                ),
+            )
+        )
+    fig.update_xaxes(type="date")
+    fig.update_layout(barmode="overlay", legend_title_text="Task")
+    return fig
+
+
+@functools.lru_cache(maxsize=16)
+def _gantt_chart(sched_key: tuple):
+    """
+    Build the timeline Gantt figure and its standalone HTML export.
+
+    Cached per schedule, so reruns that leave the milestones untouched reuse
+    both the figure and the serialized HTML.
+
+    Parameters
+    - sched_key: tuple of (name, start, end, duration_bd) rows
+
+    Returns
+    - (plotly Figure, HTML string), or (None, "") for an empty schedule
+    """
+    if not sched_key:
+        return None, ""
+    names, starts, ends, _durations = zip(*sched_key)
+    fig = _timeline_figure(names, starts, ends)
+    fig.update_yaxes(autorange="reversed")  # earliest at top
+    fig.update_layout(height=380, margin=dict(l=0, r=0, t=30, b=0))
+    return fig, fig.to_html(full_html=True, include_plotlyjs="cdn")
+
+
+@functools.lru_cache(maxsize=8)
+def _gantt_export_figure(rows_key: tuple):
+    """
+    Build the export Gantt figure and its standalone HTML bytes, per schedule.
+
+    Parameters
+    - rows_key: tuple of (task, start, finish) rows
+
+    Returns
+    - (plotly Figure, HTML bytes)
+    """
+    fig = _timeline_figure(*zip(*rows_key))
+    fig.update_yaxes(autorange="reversed")
+    return fig, fig.to_html(full_html=True, include_plotlyjs="cdn").encode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _gantt_export_png(rows_key: tuple) -> bytes:
+    """
+    Render the export Gantt figure to PNG bytes (requires kaleido).
+
+    Errors propagate so lru_cache only keeps successful renders; a missing or
+    failed kaleido is retried on the next export.
+    """
+    fig, _html = _gantt_export_figure(rows_key)
+    return fig.to_image(format="png", scale=2)
+
+
+def _gantt_export_bytes(rows_key: tuple):
+    """
+    Return the export Gantt chart as PNG and standalone HTML bytes.
+
+    The figure/HTML and successful PNG renders are cached per schedule, so
+    repeated exports of an unchanged timeline skip the kaleido round-trip.
+
+    Parameters
+    - rows_key: tuple of (task, start, finish) rows
 
     Returns
-    - dict: Mapping of semantic color names to hex codes used throughout the UI.
+    - (PNG bytes or None when kaleido is unavailable, HTML bytes)
     """
-    hr_color_dict = {
+    _fig, html_bytes = _gantt_export_figure(rows_key)
+    try:
+        png_bytes = _gantt_export_png(rows_key)
+    except Exception:
+        png_bytes = None
+    return png_bytes, html_bytes
+
+
+@functools.lru_cache(maxsize=None)
+def _read_image_bytes(path: str) -> bytes:
+    """
+    Read a bundled image once per process so reruns don't reopen the file.
+
+    OSError propagates so a failed read is never cached.
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _image_bytes(path: str):
+    """
+    Return a bundled image's bytes, read once per process.
+
+    Falls back to returning the path (st.image accepts either) if the file
+    cannot be read; the read is retried on the next call.
+    """
+    try:
+        return _read_image_bytes(path)
+    except OSError:
+        return path
+
+
+# Branding icon bundled into export ZIPs (absolute, so it resolves from any page)
+_NAF_ICON_PATH = (
+    (Path(__file__).parent / "images" / "naf_icon.png").resolve().as_posix()
+)
+
+# Branding palette; built once and shared as a read-only view
+_HR_COLORS = MappingProxyType(
+    {
         "naf_yellow": "#fffe03",
         "eia_blue": "#92c0e4",
         "eia_dkblue": "#122e43",
     }
-    return hr_color_dict
+)
+
+
+def hr_colors():
+    """
+    Return the color palette used for horizontal rules and branding accents.
+
+    Returns
+    - Mapping: Semantic color names to hex codes used throughout the UI.
+      The same read-only module-level mapping is returned on every call.
+    """
+    return _HR_COLORS
+
 
+_HR_TPL: Final[str] = (
+    '<hr style="border:none;height:{t}px;background-color:{c};margin:{m};">'
+)
 
-def thick_hr(color: str = "red", thickness: int = 3, margin: str = "1rem 0"):
+
+@functools.lru_cache(maxsize=32)
+def _hr_html(color: str, thickness: int, margin: str) -> str:
+    """Return the <hr> markup for thick_hr; memoized per style."""
+    return _HR_TPL.format_map({"t": thickness, "c": color, "m": margin})
+
+
+def thick_hr(
+    color: str = "red",
+    thickness: int = 3,
+    margin_y_px: int = 16,
+    margin: Optional[str] = None,
+):
     """
     Render a visually thick horizontal rule using raw HTML via Streamlit.
 
     Parameters
     - color (str): CSS color value for the rule background.
     - thickness (int): Pixel height of the bar.
-    - margin (str): CSS margin shorthand applied to the rule container.
+    - margin_y_px (int): Vertical margin in pixels above and below the rule.
+    - margin (Optional[str]): CSS margin shorthand; overrides margin_y_px when
+      given (kept for callers that need asymmetric spacing).
 
     Notes
     - Uses st.markdown with unsafe_allow_html=True to inject an <hr>-like element.
     - Prefer this for consistent separators across expanders/sidebars.
     """
-    st.markdown(
-        f"""
-        <hr style="
-            border: none;
-            height: {thickness}px;
-            background-color: {color};
-            margin: {margin};
-        ">
-        """,
-        unsafe_allow_html=True,
+    if margin is None:
+        margin = f"{margin_y_px}px 0"
+    st.markdown(_hr_html(color, thickness, margin), unsafe_allow_html=True)
+
+
+def _reset_wizard_state(overwrite: bool = False) -> None:
+    """
+    Clear wizard-related session state.
+
+    Parameters
+    - overwrite (bool): True when clearing ahead of an uploaded JSON (Overwrite mode).
+      Also drops the persisted _wizard_/_widget_ keys and skips restoring defaults,
+      since the upload supplies the values.
+    """
+    # Single pass over a snapshot: drop wizard keys and force-uncheck
+    # any checkbox/toggle keys Streamlit may retain.
+    prefixes = _OVERWRITE_PREFIXES if overwrite else _RESET_PREFIXES
+    for k in tuple(st.session_state.keys()):
+        if k.startswith(prefixes):
+            st.session_state.pop(k, None)
+        elif k.startswith(_CHECKBOX_PREFIXES):
+            st.session_state[k] = False
+    # Disable any custom enable toggles; set My Role radios to sentinel explicitly
+    st.session_state.update(_CLEARED_STATE)
+    for k in _RESET_POP_KEYS:
+        st.session_state.pop(k, None)
+    if overwrite:
+        return
+    st.session_state.update(_RESET_DEFAULTS)
+
+
+# Shared read-only stand-in for a missing/non-object section of an uploaded JSON
+_EMPTY_MAP = MappingProxyType({})
+
+
+def _get_map(d, key: str):
+    """Return d[key] when it is a dict, else the shared empty mapping."""
+    v = d.get(key)
+    return v if isinstance(v, dict) else _EMPTY_MAP
+
+
+def _selections(data, section: str):
+    """Return data[section]["selections"] from an uploaded export, or an empty mapping."""
+    return _get_map(_get_map(data, section), "selections")
+
+
+def _multi_select_state(
+    patch: dict,
+    data: dict,
+    section: str,
+    field: str,
+    prefix: str,
+    known,
+    enable_key,
+    other_key,
+    join_other: bool,
+) -> None:
+    """
+    Collect the session-state values for one multi-select group of an uploaded export.
+
+    Parameters
+    - patch (dict): Session-state patch to add keys to.
+    - data (dict): Parsed export.
+    - section, field (str): Read from data[section]["selections"][field].
+    - prefix (str): Checkbox key prefix; known values set f"{prefix}{value}" to True.
+    - known: Set of known options, or None to treat every value as known.
+    - enable_key, other_key: Session keys for the "other" toggle and its text.
+    - join_other (bool): Comma-join all unknown values instead of keeping the last.
+    """
+    sel = _selections(data, section)
+    unknown = []
+    for v in sel.get(field, []) or []:
+        if known is None or v in known:
+            patch[f"{prefix}{v}"] = True
+        else:
+            unknown.append(v)
+    if unknown:
+        patch[enable_key] = True
+        patch[other_key] = ", ".join(unknown) if join_other else unknown[-1]
+
+
+# Top-level sections of a wizard export and the JSON type each must have when present
+_EXPORT_SECTION_TYPES = {
+    "initiative": dict,
+    "my_role": dict,
+    "presentation": dict,
+    "intent": dict,
+    "observability": dict,
+    "orchestration": dict,
+    "collector": dict,
+    "executor": dict,
+    "timeline": dict,
+    "use_cases": list,
+    "dependencies": list,
+}
+
+
+def _export_shape_error(data) -> str:
+    """
+    Check the top-level shape of an uploaded wizard export.
+
+    Returns
+    - str: Message for the first problem found, or "" when the shape is valid.
+    """
+    if not isinstance(data, dict):
+        return "Uploaded JSON is not a valid Solution Wizard export (expected an object)."
+    for key, expected in _EXPORT_SECTION_TYPES.items():
+        value = data.get(key)
+        if value is not None and not isinstance(value, expected):
+            kind = "an object" if expected is dict else "a list"
+            return f"Uploaded JSON is not a valid Solution Wizard export ('{key}' should be {kind})."
+    return ""
+
+
+def _parse_start_date(value):
+    """
+    Parse an exported timeline start date.
+
+    Accepts YYYY-MM-DD or an ISO datetime (only the date part is kept), plus
+    the non-padded YYYY-M-D form strptime allows. Returns None when unparseable.
+    """
+    text = str(value).strip()
+    try:
+        # C fast path for the format the wizard itself exports
+        return datetime.date.fromisoformat(text[:10])
+    except ValueError:
+        pass
+    try:
+        return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _export_to_state(data: dict) -> dict:
+    """
+    Translate an uploaded export into the session-state values it restores.
+
+    Parameters
+    - data (dict): Parsed naf_report_*.json payload.
+
+    Returns
+    - dict: Session-state key -> value patch. Nothing is written to st.session_state.
+    """
+    patch = {}
+
+    # Load Initiative data
+    ini = _get_map(data, "initiative")
+    if ini.get("title") is not None:
+        patch["_wizard_automation_title"] = str(ini.get("title") or "")
+    if ini.get("description") is not None:
+        patch["_wizard_automation_description"] = str(
+            ini.get("description") or ""
+        )
+    if ini.get("expected_use") is not None:
+        patch["_wizard_expected_use"] = str(ini.get("expected_use") or "")
+    if ini.get("out_of_scope") is not None:
+        patch["_wizard_out_of_scope"] = str(ini.get("out_of_scope") or "")
+    if ini.get("no_move_forward") is not None:
+        patch["no_move_forward"] = ini.get("no_move_forward")
+    if ini.get("no_move_forward_reasons") is not None:
+        # Set the widget key directly
+        vals = ini.get("no_move_forward_reasons") or []
+        if isinstance(vals, list):
+            patch["no_move_forward_reasons"] = vals
+        else:
+            patch["no_move_forward_reasons"] = []
+    # ignore legacy initiative.solution_details_md in uploads
+
+    # Use Cases (optional top-level list of dicts)
+    if "use_cases" in data:
+        ucs = data.get("use_cases") or []
+        if isinstance(ucs, list):
+            # Shallow-copy to avoid accidental shared references
+            patch["use_cases"] = [
+                dict(uc) if isinstance(uc, dict) else {} for uc in ucs
+            ]
+        else:
+            patch["use_cases"] = []
+
+    # My Role
+    my_role = _get_map(data, "my_role")
+    who = (my_role.get("who") or "").strip()
+    skills = (my_role.get("skills") or "").strip()
+    dev = (my_role.get("developer") or "").strip()
+    # For each, set radio to value or 'Other' and capture other text
+    if who:
+        if who in _KNOWN_WHO:
+            patch["my_role_who"] = who
+        else:
+            patch["my_role_who"] = "Other (fill in)"
+            patch["my_role_who_other"] = who
+    if skills:
+        if skills in _KNOWN_SKILLS:
+            patch["my_role_skills"] = skills
+        else:
+            patch["my_role_skills"] = "Other (fill in)"
+            patch["my_role_skills_other"] = skills
+    if dev:
+        if dev in _KNOWN_DEV_ROLE:
+            patch["my_role_dev"] = dev
+        else:
+            patch["my_role_dev"] = "Other (fill in)"
+            patch["my_role_dev_other"] = dev
+
+    # Multi-select groups (Presentation/Intent/Observability/Collector)
+    for spec in _MULTI_SELECT_SPECS:
+        _multi_select_state(patch, data, *spec)
+
+    # Observability
+    obs_sel = _selections(data, "observability")
+    if obs_sel.get("go_no_go_text") is not None:
+        patch["obs_go_no_go"] = obs_sel.get("go_no_go_text")
+    patch["obs_add_logic_choice"] = (
+        "Yes" if obs_sel.get("additional_logic_enabled") else "No"
     )
+    if obs_sel.get("additional_logic_text") is not None:
+        patch["obs_add_logic_text"] = obs_sel.get("additional_logic_text")
+
+    # Orchestration
+    orch_sel = _selections(data, "orchestration")
+    if orch_sel.get("choice") is not None:
+        patch["orch_choice"] = orch_sel.get("choice")
+    if orch_sel.get("details") is not None:
+        patch["orch_details_text"] = orch_sel.get("details")
+
+    # Collector
+    col_sel = _selections(data, "collector")
+    if col_sel.get("devices") is not None:
+        patch["collector_devices"] = str(col_sel.get("devices"))
+    if col_sel.get("metrics_per_sec") is not None:
+        patch["collector_metrics"] = str(col_sel.get("metrics_per_sec"))
+    if col_sel.get("cadence") is not None:
+        patch["collector_cadence"] = str(col_sel.get("cadence"))
+
+    # Executor
+    exec_sel = _selections(data, "executor")
+    for m in exec_sel.get("methods", []) or []:
+        i = _EXEC_OPTION_INDEX.get(m)
+        if i is not None:
+            patch[f"exec_{i}"] = True
+        else:
+            # Custom executor method
+            patch["exec_custom_enable"] = True
+            patch["exec_custom_text"] = m
+
+    # Dependencies
+    dep_list = data.get("dependencies") or ()
+    for d in dep_list:
+        if not isinstance(d, dict):
+            continue
+        keys = _DEP_STATE_KEYS.get(d.get("name"))
+        if keys:
+            patch[keys[0]] = True
+            details = d.get("details")
+            if details:
+                patch[keys[1]] = details
+
+    # Timeline basics
+    tl = _get_map(data, "timeline")
+    staff = tl.get("staff_count")
+    plan = tl.get("staffing_plan_md")
+    region = tl.get("holiday_region")
+    start = tl.get("start_date")
+    if staff is not None:
+        staff = int(staff or 0)
+        patch["timeline_staff_count"] = staff
+        patch["_timeline_staff_count"] = staff
+    if plan is not None:
+        patch["timeline_staffing_plan"] = plan
+        patch["_timeline_staffing_plan"] = plan
+    if region is not None:
+        region = region or "None"
+        patch["timeline_holiday_region"] = region
+        patch["_timeline_holiday_region"] = region
+    if start:
+        parsed = _parse_start_date(start)
+        if parsed is not None:
+            patch["timeline_start_date"] = parsed
+            patch["_timeline_start_date_input"] = parsed
+
+    # Timeline milestones from items
+    items = tl.get("items") or []
+    if isinstance(items, list) and items:
+        # The milestone editor state (_timeline_*) is dropped by
+        # _reset_wizard_state() before this patch is applied, so the editor
+        # reloads from timeline_milestones
+        ms = []
+        for it in items:
+            if not isinstance(it, dict):
+                it = _EMPTY_MAP
+            nm = str(it.get("name") or "").strip()
+            try:
+                dur = int(it.get("duration_bd") or 0)
+            except (TypeError, ValueError):
+                dur = 0
+            notes = str(it.get("notes") or "")
+            ms.append(
+                {
+                    "name": nm,
+                    "duration": dur,
+                    "notes": notes,
+                }
+            )
+        if ms:
+            patch["timeline_milestones"] = ms
+    return patch
+
+
+def _apply_uploaded_json(data: dict) -> None:
+    """
+    Overwrite the wizard session state with the contents of an uploaded export.
+
+    Parameters
+    - data (dict): Parsed naf_report_*.json payload.
+    """
+    # Build the full patch first so a malformed value leaves the session untouched
+    patch = _export_to_state(data)
+    # Clear ALL existing wizard-related state before applying (Overwrite mode)
+    _reset_wizard_state(overwrite=True)
+    st.session_state.update(patch)
+
+
+def _render_json_loader() -> None:
+    """Render the Reset / Upload-and-apply controls for a saved wizard JSON."""
+    with st.expander("Load Saved Solution Wizard (JSON)", expanded=False):
+        # Sidebar import/reset controls.
+        #
+        # - Reset to defaults: clears wizard-related session state and restores defaults.
+        # - Upload naf_report_*.json: allows Merge/Overwrite to rehydrate a previous session.
+        # - Filename must match naf_report_*.json; otherwise show guidance.
+
+        # Reset to defaults
+        if st.button(
+            "Reset to defaults",
+            use_container_width=True,
+            key="wizard_reset_defaults_btn",
+        ):
+            _reset_wizard_state()
+            st.rerun()
+
+        # Sample JSON download removed per request
+
+        uploaded = st.file_uploader(
+            "Upload naf_report_*.json", type=["json"], key="wizard_upload_json"
+        )
+        if uploaded is not None:
+            fname = (uploaded.name or "").strip()
+            if not fname.lower().endswith(".json"):
+                st.error(
+                    "Invalid file. Please upload a .json file exported from this tool."
+                )
+            elif not fname.lower().startswith("naf_report_"):
+                st.info(
+                    "Tip: Expected a file named like 'naf_report_*.json' (use the Save Solution Artifacts download). Rename the file or download a fresh export."
+                )
+            else:
+                if st.button(
+                    "Apply uploaded JSON",
+                    type="primary",
+                    key="wizard_apply_upload_btn",
+                ):
+                    try:
+                        with st.spinner("Applying uploaded configuration..."):
+                            data = _json_loads(uploaded.getvalue())
+                            # Validate before touching session state so a bad file
+                            # doesn't wipe the current wizard answers
+                            shape_error = _export_shape_error(data)
+                            if not shape_error:
+                                _apply_uploaded_json(data)
+                        if shape_error:
+                            st.error(shape_error)
+                        else:
+                            st.success(
+                                "Applied uploaded JSON to this session. Widgets will reflect values now."
+                            )
+                            st.rerun()
+
+                    except Exception as e:
+                        st.error(f"Failed to load JSON: {e}")
 
 
 def render_global_sidebar() -> None:
@@ -78,7 +1295,7 @@ def render_global_sidebar() -> None:
     Includes the EIA logo, external links, and bottom NAF branding bar.
     """
 
-    hr_color_dict = hr_colors()
+    hr_color_dict = _HR_COLORS
 
     with st.sidebar:
 
@@ -87,7 +1304,9 @@ def render_global_sidebar() -> None:
         # Top branding: logo and EIA links
         col_logo, col_links = st.columns([1, 2])
         with col_logo:
-            st.image("images/EIA Logo FINAL small_Round.png", width="stretch")
+            st.image(
+                _image_bytes("images/EIA Logo FINAL small_Round.png"), width="stretch"
+            )
         with col_links:
             st.markdown("[🏠 EIA Home](https://eianow.com)")
             st.markdown(
@@ -97,14 +1316,14 @@ def render_global_sidebar() -> None:
         thick_hr(
             color=hr_color_dict.get("eia_blue", "#92c0e4"),
             thickness=6,
-            margin="0.5rem 0",
+            margin_y_px=8,
         )
 
         # Bottom NAF branding bar with NAF icon
 
         _naf_logo_col, _naf_link_col = st.columns([1, 2])
         with _naf_logo_col:
-            st.image("images/naf_icon.png", width="stretch")
+            st.image(_image_bytes("images/naf_icon.png"), width="stretch")
         with _naf_link_col:
             st.markdown("[🏠 NAF Home](https://networkautomation.forum/)")
             # linkedin.com/company/network-automation-forum/
@@ -117,7 +1336,90 @@ def render_global_sidebar() -> None:
             margin="0.75rem 0 0.25rem 0",
         )
 
-def join_human(items: List[str]):
+
+def _role_answer(choice: str, other: str) -> str:
+    """
+    Normalize a My Role radio answer for the payload.
+
+    Returns the free-text answer for "Other (fill in)", "" for the unselected
+    sentinel, otherwise the chosen label.
+    """
+    if choice == "Other (fill in)":
+        return (other or "").strip()
+    if choice == _SELECT_SENTINEL:
+        return ""
+    return choice or ""
+
+
+def _checkbox_grid(options, key_prefix: str, cols) -> List[str]:
+    """
+    Render one checkbox per option, spread round-robin across columns.
+
+    Parameters
+    - options: Option labels; each checkbox is keyed f"{key_prefix}{label}".
+    - key_prefix (str): Session-state key prefix for the group.
+    - cols: Streamlit columns to place the checkboxes in.
+
+    Returns
+    - List[str]: Labels of the checked options, in option order.
+    """
+    selected = []
+    ncols = len(cols)
+    for i, opt in enumerate(options):
+        with cols[i % ncols]:
+            if st.checkbox(opt, key=f"{key_prefix}{opt}"):
+                selected.append(opt)
+    return selected
+
+
+def _checkbox_group(
+    options,
+    key_prefix: str,
+    cols,
+    other_enable_key: str,
+    other_key: str,
+    other_label: str,
+) -> List[str]:
+    """
+    Render a checkbox grid followed by an "Other (fill in)" checkbox and text input.
+
+    Parameters
+    - options: Option labels passed to _checkbox_grid.
+    - key_prefix (str): Session-state key prefix for the option checkboxes.
+    - cols: Streamlit columns to place the option checkboxes in.
+    - other_enable_key (str): Key of the "Other (fill in)" checkbox.
+    - other_key (str): Key of the free-text input shown when Other is enabled.
+    - other_label (str): Label of the free-text input.
+
+    Returns
+    - List[str]: Checked labels in option order, plus the stripped Other text if given.
+    """
+    selected = _checkbox_grid(options, key_prefix, cols)
+    if st.checkbox("Other (fill in)", key=other_enable_key):
+        other_text = (st.text_input(other_label, key=other_key) or "").strip()
+        if other_text:
+            selected.append(other_text)
+    return selected
+
+
+def _render_preview(lines, empty_msg: str) -> None:
+    """
+    Render a section's "Preview Solution Highlights" block.
+
+    Parameters
+    - lines: Highlight sentences; blank entries are skipped.
+    - empty_msg (str): Info message shown when no sentence remains.
+    """
+    thick_hr(color="#6785a0", thickness=3)
+    st.markdown("**Preview Solution Highlights**")
+    bullets = "\n".join(f"- {ln}" for ln in lines if ln and ln.strip())
+    if bullets:
+        st.markdown(bullets)
+    else:
+        st.info(empty_msg)
+
+
+def join_human(items: List[str], prefiltered: bool = False):
     """
     Join a list of strings into a human-friendly phrase.
 
@@ -127,13 +1429,19 @@ def join_human(items: List[str]):
     - ["A","B","C"] -> "A, B and C"
 
     Returns "TBD" when the input is empty or only contains falsey values.
+    Callers that guarantee a list of non-empty strings may pass
+    prefiltered=True to skip the filtering pass.
     """
-    items = [i for i in (items or []) if i]
-    if not items:
+    if not (prefiltered and items):
+        items = [i for i in items or () if i]
+    n = len(items)
+    if n == 0:
         return "TBD"
-    if len(items) == 1:
+    if n == 1:
         return items[0]
-    return ", ".join(items[:-1]) + f" and {items[-1]}"
+    if n == 2:
+        return items[0] + " and " + items[1]
+    return ", ".join(items[:-1]) + " and " + items[-1]
 
 
 def md_line(text: str) -> str:
@@ -149,39 +1457,245 @@ def md_line(text: str) -> str:
     return f"- {text}" if text else ""
 
 
+# "TBD" as a standalone word, so words that merely contain it still count
+_TBD_RE = re.compile(r"\btbd\b")
+# Default narrative sentences (lower-cased) that is_meaningful treats as empty
+_DEFAULT_PLACEHOLDERS = frozenset(
+    {
+        "no additional gating logic beyond the defined go/no-go criteria.",
+        "this solution will not employ a distinct orchestration layer.",
+    }
+)
+
+
 def is_meaningful(text: str) -> bool:
     """
     Determine if a narrative string is considered meaningful content.
 
     Rules
     - Empty/whitespace -> False
-    - Contains "tbd" (case-insensitive) -> False
+    - Contains the word "TBD" (case-insensitive) -> False
     - Matches any known default placeholder sentence -> False
     - Otherwise -> True
     """
     if not text:
         return False
     t = text.strip().lower()
-    if not t or "tbd" in t:
-        return False
-    default_placeholders = {
-        "no additional gating logic beyond the defined go/no-go criteria.",
-        "this solution will not employ a distinct orchestration layer.",
-    }
-    return t not in default_placeholders
+    return bool(t) and not _TBD_RE.search(t) and t not in _DEFAULT_PLACEHOLDERS
 
 
 def _join(items):
     """
     Alias to join_human for brevity where a shorter name reads better.
 
+    Callers pass checkbox selections from _checkbox_grid/_checkbox_group (or
+    built the same way), which only ever hold non-empty labels and stripped
+    free text, so join_human's filtering pass is skipped.
+
     Parameters
-    - items (List[str]): Strings to join human-readably.
+    - items (List[str]): Non-empty strings to join human-readably.
 
     Returns
     - str: Humanized join of items or "TBD" when empty.
     """
-    return join_human(items)
+    return join_human(items, prefiltered=True)
+
+
+def _dep_pairs(deps) -> List[Tuple[str, str]]:
+    """
+    Reduce payload dependency entries to ordered (name, details) pairs.
+
+    Parameters
+    - deps (list): Dependency dicts from the wizard payload.
+
+    Returns
+    - List[Tuple[str, str]]: Named entries with stripped details.
+    """
+    return [
+        (d["name"], (d.get("details") or "").strip())
+        for d in deps or ()
+        if d and d.get("name")
+    ]
+
+
+def _json_bytes(obj) -> bytes:
+    """
+    Serialize a payload as UTF-8 JSON indented by two spaces.
+
+    Uses orjson when it is installed and falls back to the stdlib encoder
+    (also for values orjson rejects, such as integers beyond 64 bits). The
+    fallback writes non-ASCII characters unescaped, like orjson, so the
+    exported bytes don't depend on which encoder is installed.
+
+    Parameters
+    - obj: JSON-compatible payload.
+
+    Returns
+    - bytes: Encoded document.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _fmt_ts(n: datetime.datetime) -> str:
+    """Format a datetime as the YYYYMMDD_HHMMSS stamp used in export file names."""
+    return (
+        f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
+    )
+
+
+def _sanitize_title(t: str) -> str:
+    """
+    Turn an initiative title into a short, file-name-safe slug.
+
+    Parameters
+    - t (str): Raw title text.
+
+    Returns
+    - str: At most 30 characters of letters, digits, '-' and single '_'
+      separators, or "solution" when nothing usable remains.
+    """
+    t = _SANITIZE_RE.sub("_", (t or "").strip()).strip("_")
+    return (t or "solution")[0:30]
+
+
+def _has_any_content(p: dict) -> bool:
+    """
+    Determine if a wizard payload holds anything beyond the untouched defaults.
+
+    Narrative strings are preferred over raw selections because they already
+    read "TBD" for empty sections and are filtered through is_meaningful. The
+    default dependency pair, default timeline and default initiative text do
+    not count as content.
+
+    Parameters
+    - p (dict): Payload compiled by solution_wizard_main().
+
+    Returns
+    - bool: True when at least one section carries user-provided content.
+    """
+    try:
+        pres_narr = _get_map(p, "presentation")
+        intent_narr = _get_map(p, "intent")
+        obs_narr = _get_map(p, "observability")
+        orch_narr = _get_map(p, "orchestration")
+        coll_narr = _get_map(p, "collector")
+        exec_narr = _get_map(p, "executor")
+        deps = p.get("dependencies", []) or []
+        tl = _get_map(p, "timeline")
+        ini = _get_map(p, "initiative")
+        my_role = _get_map(p, "my_role")
+
+        # Sections are checked in order; the first one with content returns
+        # early and the remaining checks are skipped.
+        # Narrative-based checks (suppressed when 'TBD' or placeholder text)
+        _m = is_meaningful
+        if (
+            _m(pres_narr.get("users"))
+            or _m(pres_narr.get("interaction"))
+            or _m(pres_narr.get("tools"))
+            or _m(pres_narr.get("auth"))
+        ):
+            return True
+        if _m(intent_narr.get("development")) or _m(intent_narr.get("provided")):
+            return True
+        if (
+            _m(obs_narr.get("methods"))
+            or _m(obs_narr.get("go_no_go"))
+            or _m(obs_narr.get("additional_logic"))
+            or _m(obs_narr.get("tools"))
+        ):
+            return True
+        _orch_sel = _get_map(orch_narr, "selections")
+        _orch_choice = (_orch_sel.get("choice") or "").strip()
+        # Count any non-sentinel choice (including 'No') as content for gating exports
+        if (_orch_choice and _orch_choice != _SELECT_SENTINEL) or _m(
+            orch_narr.get("summary")
+        ):
+            return True
+        if (
+            _m(coll_narr.get("methods"))
+            or _m(coll_narr.get("auth"))
+            or _m(coll_narr.get("handling"))
+            or _m(coll_narr.get("normalization"))
+            or _m(coll_narr.get("scale"))
+            or _m(coll_narr.get("tools"))
+        ):
+            return True
+        if _m(exec_narr.get("methods")):
+            return True
+
+        # Dependencies: treat default pair as no content
+        if deps and frozenset(_dep_pairs(deps)) != _DEFAULT_DEPS_FSET:
+            return True
+
+        # Timeline: do NOT trigger content based on default items/dates
+        # Only consider as content if staffing plan markdown has text
+        if (tl.get("staffing_plan_md") or "").strip():
+            return True
+
+        # Initiative: ignore known defaults
+        title = (ini.get("title") or "").strip()
+        desc = (ini.get("description") or "").strip()
+        if (title and title != _DEFAULT_TITLE) or (desc and desc != _DEFAULT_DESC):
+            return True
+        # My Role: any non-empty answer
+        return bool(
+            (my_role.get("who") or "").strip()
+            or (my_role.get("skills") or "").strip()
+            or (my_role.get("developer") or "").strip()
+        )
+    except Exception:
+        pass
+    return False
+
+
+def _export_gate(p: dict, session_orch_choice: str = ""):
+    """
+    Compute the signals that decide whether the artifact download is offered.
+
+    Parameters
+    - p (dict): Payload compiled by solution_wizard_main().
+    - session_orch_choice (str): Orchestration radio value from session state,
+      used when the payload carries no choice.
+
+    Returns
+    - tuple: (has_any_selection, role_nonempty, ini_nondefault, orch_nondefault)
+    """
+    sel = {
+        "pres": _selections(p, "presentation"),
+        "intent": _selections(p, "intent"),
+        "obs": _selections(p, "observability"),
+        "orch": _selections(p, "orchestration"),
+        "coll": _selections(p, "collector"),
+        "exec": _selections(p, "executor"),
+    }
+
+    # Any non-empty list among the section selections (empty lists are falsy)
+    has_any_selection = any(
+        val and isinstance(val, list) for d in sel.values() for val in d.values()
+    )
+    my_role = _get_map(p, "my_role")
+    role_nonempty = any(
+        (my_role.get(k) or "").strip() for k in ("who", "skills", "developer")
+    )
+    ini = _get_map(p, "initiative")
+    _title = (ini.get("title") or "").strip()
+    _desc = (ini.get("description") or "").strip()
+    ini_nondefault = bool(
+        (_title and _title != _DEFAULT_TITLE) or (_desc and _desc != _DEFAULT_DESC)
+    )
+    orch_sel = sel["orch"]
+    orch_choice = (orch_sel.get("choice") or "").strip() or (
+        session_orch_choice or ""
+    ).strip()
+    # Treat any non-sentinel choice (including 'No') as a meaningful change for gating
+    orch_nondefault = bool(orch_choice and orch_choice != _SELECT_SENTINEL)
+    return has_any_selection, role_nonempty, ini_nondefault, orch_nondefault
 
 
 def solution_wizard_main():
@@ -219,725 +1733,14 @@ def solution_wizard_main():
         layout="wide",
     )
 
-    # Global sidebar branding (shared across pages)
-    render_global_sidebar()
-
-    # Colors for main content separators
-    hr_color_dict = hr_colors()
-
-    # JSON upload/reset controls now live in the main page body
-    with st.expander("Load Saved Solution Wizard (JSON)", expanded=False):
-        # Sidebar import/reset controls.
-        #
-        # - Reset to defaults: clears wizard-related session state and restores defaults.
-        # - Upload naf_report_*.json: allows Merge/Overwrite to rehydrate a previous session.
-        # - Filename must match naf_report_*.json; otherwise show guidance.
-
-        # Reset to defaults
-        if st.button(
-            "Reset to defaults",
-            use_container_width=True,
-            key="wizard_reset_defaults_btn",
-        ):
-                prefixes = (
-                    "pres_",
-                    "intent_",
-                    "obs_",
-                    "orch_",
-                    "collector_",
-                    "collection_tool_",
-                    "collection_tools_",
-                    "exec_",
-                    "my_role_",
-                    "dep_",
-                    "_tl_",
-                    "_timeline_",
-                    "obs_tool_",
-                    "obs_state_",
-                    "collector_method_",
-                    "collector_auth_",
-                    "collector_handle_",
-                    "collector_norm_",
-                )
-                for k in list(st.session_state.keys()):
-                    if any([k.startswith(p) for p in prefixes]):
-                        st.session_state.pop(k, None)
-                # Force-uncheck known checkbox/toggle keys in case Streamlit retains widget states
-                for k in list(st.session_state.keys()):
-                    if k.startswith(
-                        (
-                            "pres_user_",
-                            "pres_interact_",
-                            "pres_tool_",
-                            "pres_auth_",
-                            "intent_dev_",
-                            "intent_prov_",
-                            "obs_state_",
-                            "obs_tool_",
-                            "collector_method_",
-                            "collector_auth_",
-                            "collector_handle_",
-                            "collector_norm_",
-                            "collection_tool_",
-                            "collection_tools_",
-                        )
-                    ):
-                        st.session_state[k] = False
-                # Disable any custom enable toggles
-                for k in [
-                    "pres_user_custom_enable",
-                    "pres_interact_custom_enable",
-                    "pres_tool_custom_enable",
-                    "pres_auth_other_enable",
-                    "intent_dev_custom_enable",
-                    "intent_prov_custom_enable",
-                    "obs_tool_other_enable",
-                    "collector_methods_other_enable",
-                    "collector_auth_other_enable",
-                    "collector_handling_other_enable",
-                    "collector_norm_other_enable",
-                    "collection_tools_other_enable",
-                ]:
-                    st.session_state[k] = False
-                for k in [
-                    "automation_title",
-                    "automation_description",
-                    "expected_use",
-                    "out_of_scope",
-                    "timeline_staff_count",
-                    "timeline_staffing_plan",
-                    "timeline_holiday_region",
-                    "timeline_start_date",
-                    "timeline_milestones",
-                    "collector_devices",
-                    "collector_metrics",
-                    "collector_cadence",
-                    "orch_choice",
-                    "orch_details_text",
-                    "obs_go_no_go",
-                    "obs_add_logic_choice",
-                    "obs_add_logic_text",
-                ]:
-                    st.session_state.pop(k, None)
-                # Minimal sane defaults
-                st.session_state["dep_network_infra"] = True
-                st.session_state["dep_revision_control"] = True
-                st.session_state["dep_revision_control_details"] = "GitHub"
-                # Also set My Role radios to sentinel explicitly
-                st.session_state["my_role_who"] = "— Select one —"
-                st.session_state["my_role_skills"] = "— Select one —"
-                st.session_state["my_role_dev"] = "— Select one —"
-                st.session_state.pop("my_role_who_other", None)
-                st.session_state.pop("my_role_skills_other", None)
-                st.session_state.pop("my_role_dev_other", None)
-                # Initiative defaults (use _wizard_ keys to persist across pages)
-                st.session_state["_wizard_automation_title"] = (
-                    "My new network automation project"
-                )
-                st.session_state["_wizard_automation_description"] = (
-                    "Here is a short description of my my new network automation project"
-                )
-                st.session_state["_wizard_expected_use"] = (
-                    "This automation will be used whenever this task needs to be executed. See Use Cases for more details."
-                )
-                st.session_state["_wizard_out_of_scope"] = ""
-                st.session_state["no_move_forward"] = ""
-                # Let the widget own no_move_forward_reasons; ensure any existing value is cleared
-                st.session_state.pop("no_move_forward_reasons", None)
-                # no separate details field; report is generated
-                # Orchestration defaults so select resets visually
-                st.session_state["orch_choice"] = "— Select one —"
-                st.session_state["orch_details_text"] = ""
-                st.rerun()
-
-        # Sample JSON download removed per request
+    # Global sidebar branding (shared across pages)
+    render_global_sidebar()
 
-        uploaded = st.file_uploader(
-            "Upload naf_report_*.json", type=["json"], key="wizard_upload_json"
-        )
-        if uploaded is not None:
-            fname = (uploaded.name or "").strip()
-            if not fname.lower().endswith(".json"):
-                st.error(
-                    "Invalid file. Please upload a .json file exported from this tool."
-                )
-            elif not fname.lower().startswith("naf_report_"):
-                st.info(
-                    "Tip: Expected a file named like 'naf_report_*.json' (use the Save Solution Artifacts download). Rename the file or download a fresh export."
-                )
-            else:
-                if st.button(
-                    "Apply uploaded JSON",
-                    type="primary",
-                    key="wizard_apply_upload_btn",
-                ):
-                        try:
-                            data = json.load(uploaded)
-                            if not isinstance(data, dict):
-                                st.error(
-                                    "Uploaded JSON is not a valid Solution Wizard export (expected an object)."
-                                )
-                            else:
-                                # Clear ALL existing wizard-related state before applying (Overwrite mode)
-                                prefixes = (
-                                    "pres_",
-                                    "intent_",
-                                    "obs_",
-                                    "orch_",
-                                    "collector_",
-                                    "collection_tool_",
-                                    "collection_tools_",
-                                    "exec_",
-                                    "my_role_",
-                                    "dep_",
-                                    "_tl_",
-                                    "_timeline_",
-                                    "obs_tool_",
-                                    "obs_state_",
-                                    "collector_method_",
-                                    "collector_auth_",
-                                    "collector_handle_",
-                                    "collector_norm_",
-                                    "_wizard_",
-                                    "_widget_",
-                                )
-                                for k in list(st.session_state.keys()):
-                                    if any([k.startswith(p) for p in prefixes]):
-                                        st.session_state.pop(k, None)
-                                # Force-uncheck known checkbox/toggle keys
-                                for k in list(st.session_state.keys()):
-                                    if k.startswith(
-                                        (
-                                            "pres_user_",
-                                            "pres_interact_",
-                                            "pres_tool_",
-                                            "pres_auth_",
-                                            "intent_dev_",
-                                            "intent_prov_",
-                                            "obs_state_",
-                                            "obs_tool_",
-                                            "collector_method_",
-                                            "collector_auth_",
-                                            "collector_handle_",
-                                            "collector_norm_",
-                                            "collection_tool_",
-                                            "collection_tools_",
-                                        )
-                                    ):
-                                        st.session_state[k] = False
-                                for k in [
-                                    "pres_user_custom_enable",
-                                    "pres_interact_custom_enable",
-                                    "pres_tool_custom_enable",
-                                    "pres_auth_other_enable",
-                                    "intent_dev_custom_enable",
-                                    "intent_prov_custom_enable",
-                                    "obs_tool_other_enable",
-                                    "collector_methods_other_enable",
-                                    "collector_auth_other_enable",
-                                    "collector_handling_other_enable",
-                                    "collector_norm_other_enable",
-                                    "collection_tools_other_enable",
-                                ]:
-                                    st.session_state[k] = False
-                                # Set Orchestration radio to sentinel
-                                st.session_state["orch_choice"] = "— Select one —"
-                                st.session_state["orch_details_text"] = ""
-                                # Also set My Role radios to sentinel explicitly
-                                st.session_state["my_role_who"] = "— Select one —"
-                                st.session_state["my_role_skills"] = "— Select one —"
-                                st.session_state["my_role_dev"] = "— Select one —"
-                                st.session_state.pop("my_role_who_other", None)
-                                st.session_state.pop("my_role_skills_other", None)
-                                st.session_state.pop("my_role_dev_other", None)
-                                for k in [
-                                    "automation_title",
-                                    "automation_description",
-                                    "expected_use",
-                                    "out_of_scope",
-                                    "no_move_forward",
-                                    "no_move_forward_reasons",
-                                    "timeline_milestones",
-                                    "timeline_staff_count",
-                                    "timeline_staffing_plan",
-                                    "timeline_holiday_region",
-                                    "timeline_start_date",
-                                    "collector_devices",
-                                    "collector_metrics",
-                                    "collector_cadence",
-                                    "orch_choice",
-                                    "orch_details_text",
-                                ]:
-                                    st.session_state.pop(k, None)
-                                
-                                # Load Initiative data
-                                ini = data.get("initiative", {}) or {}
-                                if ini.get("title") is not None:
-                                    st.session_state["_wizard_automation_title"] = str(
-                                        ini.get("title") or ""
-                                    )
-                                if ini.get("description") is not None:
-                                    st.session_state["_wizard_automation_description"] = str(
-                                        ini.get("description") or ""
-                                    )
-                                if ini.get("expected_use") is not None:
-                                    st.session_state["_wizard_expected_use"] = str(
-                                        ini.get("expected_use") or ""
-                                    )
-                                if ini.get("out_of_scope") is not None:
-                                    st.session_state["_wizard_out_of_scope"] = str(
-                                        ini.get("out_of_scope") or ""
-                                    )
-                                if ini.get("no_move_forward") is not None:
-                                    st.session_state["no_move_forward"] = ini.get(
-                                        "no_move_forward"
-                                    )
-                                if ini.get("no_move_forward_reasons") is not None:
-                                    # Set the widget key directly
-                                    vals = ini.get("no_move_forward_reasons") or []
-                                    if isinstance(vals, list):
-                                        st.session_state["no_move_forward_reasons"] = vals
-                                    else:
-                                        st.session_state["no_move_forward_reasons"] = []
-                                # ignore legacy initiative.solution_details_md in uploads
-
-                                # Use Cases (optional top-level list of dicts)
-                                if "use_cases" in data:
-                                    ucs = data.get("use_cases") or []
-                                    if isinstance(ucs, list):
-                                        # Shallow-copy to avoid accidental shared references
-                                        st.session_state["use_cases"] = [
-                                            dict(uc) if isinstance(uc, dict) else {}
-                                            for uc in ucs
-                                        ]
-                                    else:
-                                        st.session_state["use_cases"] = []
-
-                                # My Role
-                                my_role = data.get("my_role", {}) or {}
-                                who = (my_role.get("who") or "").strip()
-                                skills = (my_role.get("skills") or "").strip()
-                                dev = (my_role.get("developer") or "").strip()
-                                # For each, set radio to value or 'Other' and capture other text
-                                if who:
-                                    known_who = {
-                                        "I’m a network engineer.",
-                                        "I’m a software developer.",
-                                        "I manage technical projects or teams.",
-                                    }
-                                    if who in known_who:
-                                        st.session_state["my_role_who"] = who
-                                    else:
-                                        st.session_state["my_role_who"] = (
-                                            "Other (fill in)"
-                                        )
-                                        st.session_state["my_role_who_other"] = who
-                                if skills:
-                                    known_sk = {
-                                        "I have some scripting skills and basic software development experience.",
-                                        "I am an advanced software developer.",
-                                        "I provide techncial management on network and automation projects.",
-                                    }
-                                    if skills in known_sk:
-                                        st.session_state["my_role_skills"] = skills
-                                    else:
-                                        st.session_state["my_role_skills"] = (
-                                            "Other (fill in)"
-                                        )
-                                        st.session_state["my_role_skills_other"] = (
-                                            skills
-                                        )
-                                if dev:
-                                    known_dev = {
-                                        "I’ll do it myself.",
-                                        "My in-house team and I will build it.",
-                                        "We will have outside experts build it, but I’ll provide technical oversight.",
-                                    }
-                                    if dev in known_dev:
-                                        st.session_state["my_role_dev"] = dev
-                                    else:
-                                        st.session_state["my_role_dev"] = (
-                                            "Other (fill in)"
-                                        )
-                                        st.session_state["my_role_dev_other"] = dev
-
-                                # Presentation
-                                pres = data.get("presentation", {}) or {}
-                                pres_sel = pres.get("selections", {}) or {}
-                                for u in pres_sel.get("users", []) or []:
-                                    st.session_state[f"pres_user_{u}"] = True
-                                known_interact = {"CLI", "Web GUI", "Other GUI", "API"}
-                                for it in pres_sel.get("interactions", []) or []:
-                                    if it in known_interact:
-                                        st.session_state[f"pres_interact_{it}"] = True
-                                    else:
-                                        st.session_state[
-                                            "pres_interact_custom_enable"
-                                        ] = True
-                                        st.session_state["pres_interact_custom"] = it
-                                known_tools = {
-                                    "Python",
-                                    "Python Web Framework (Streamlit, Flask, etc.)",
-                                    "General Web Framework",
-                                    "Automation Framework",
-                                    "REST API",
-                                    "GraphQL API",
-                                    "Custom API",
-                                }
-                                for t in pres_sel.get("tools", []) or []:
-                                    if t in known_tools:
-                                        st.session_state[f"pres_tool_{t}"] = True
-                                    else:
-                                        st.session_state["pres_tool_custom_enable"] = (
-                                            True
-                                        )
-                                        st.session_state["pres_tool_custom"] = t
-                                known_auth = {
-                                    "No Authentication (suitable only for demos and very specific use cases)",
-                                    "Repository authorization/sharing",
-                                    "Built-in Authentication via Username/Password or TOKEN",
-                                    "Custom Authentication to external system (AD, SSH Keys, OAUTH2)",
-                                }
-                                for a in pres_sel.get("auth", []) or []:
-                                    if a in known_auth:
-                                        st.session_state[f"pres_auth_{a}"] = True
-                                    else:
-                                        st.session_state["pres_auth_other_enable"] = (
-                                            True
-                                        )
-                                        st.session_state["pres_auth_other_text"] = a
-
-                                # Intent
-                                intent = data.get("intent", {}) or {}
-                                intent_sel = intent.get("selections", {}) or {}
-                                known_dev = {
-                                    "Templates",
-                                    "Policies",
-                                    "Service Profiles",
-                                    "Model-driven (data models)",
-                                    "Declarative (YAML/JSON)",
-                                    "Forms/GUI",
-                                    "Domain-specific language (DSL)",
-                                    "GitOps workflow (PRs/Reviews)",
-                                    "API-driven",
-                                    "Import from Source of Truth (CMDB/IPAM/Inventory/Git)",
-                                }
-                                unknown_devs = []
-                                for v in intent_sel.get("development", []) or []:
-                                    if v in known_dev:
-                                        st.session_state[f"intent_dev_{v}"] = True
-                                    else:
-                                        unknown_devs.append(v)
-                                if unknown_devs:
-                                    st.session_state["intent_dev_custom_enable"] = True
-                                    st.session_state["intent_dev_custom"] = ", ".join(
-                                        unknown_devs
-                                    )
-                                known_prov = {
-                                    "Text file",
-                                    "Serialized format (JSON, YAML)",
-                                    "CSV",
-                                    "Excel",
-                                    "API",
-                                }
-                                unknown_prov = []
-                                for v in intent_sel.get("provided", []) or []:
-                                    if v in known_prov:
-                                        st.session_state[f"intent_prov_{v}"] = True
-                                    else:
-                                        unknown_prov.append(v)
-                                if unknown_prov:
-                                    st.session_state["intent_prov_custom_enable"] = True
-                                    st.session_state["intent_prov_custom"] = ", ".join(
-                                        unknown_prov
-                                    )
-
-                                # Observability
-                                obs = data.get("observability", {}) or {}
-                                obs_sel = obs.get("selections", {}) or {}
-                                for m in obs_sel.get("methods", []) or []:
-                                    st.session_state[f"obs_state_{m}"] = True
-                                known_obs_tools = {
-                                    "SuzieQ Open Source",
-                                    "SuzieQ Enterprise",
-                                    "Network Vendor Product (Cisco Catalyst Center, Arista CVP, etc.)",
-                                    "Custom Python Scripts",
-                                }
-                                for t in obs_sel.get("tools", []) or []:
-                                    if t in known_obs_tools:
-                                        st.session_state[f"obs_tool_{t}"] = True
-                                    else:
-                                        st.session_state["obs_tool_other_enable"] = True
-                                        st.session_state["obs_tool_other_text"] = t
-                                if obs_sel.get("go_no_go_text") is not None:
-                                    st.session_state["obs_go_no_go"] = obs_sel.get(
-                                        "go_no_go_text"
-                                    )
-                                st.session_state["obs_add_logic_choice"] = (
-                                    "Yes"
-                                    if obs_sel.get("additional_logic_enabled")
-                                    else "No"
-                                )
-                                if obs_sel.get("additional_logic_text") is not None:
-                                    st.session_state["obs_add_logic_text"] = (
-                                        obs_sel.get("additional_logic_text")
-                                    )
-
-                                # Orchestration
-                                orch_sel = (data.get("orchestration", {}) or {}).get(
-                                    "selections", {}
-                                )
-                                if orch_sel.get("choice") is not None:
-                                    st.session_state["orch_choice"] = orch_sel.get(
-                                        "choice"
-                                    )
-                                if orch_sel.get("details") is not None:
-                                    st.session_state["orch_details_text"] = (
-                                        orch_sel.get("details")
-                                    )
-
-                                # Collector
-                                col_sel = (data.get("collector", {}) or {}).get(
-                                    "selections", {}
-                                )
-                                for m in col_sel.get("methods", []) or []:
-                                    for known in [
-                                        "SNMP",
-                                        "CLI/SSH",
-                                        "NETCONF",
-                                        "gNMI",
-                                        "REST API",
-                                        "Webhooks",
-                                        "Syslog",
-                                        "Streaming Telemetry",
-                                    ]:
-                                        if m == known:
-                                            st.session_state[
-                                                f"collector_method_{known}"
-                                            ] = True
-                                            break
-                                    else:
-                                        st.session_state[
-                                            "collector_methods_other_enable"
-                                        ] = True
-                                        st.session_state["collector_methods_other"] = m
-                                for a in col_sel.get("auth", []) or []:
-                                    for known in [
-                                        "Username/Password",
-                                        "SSH Keys",
-                                        "OAuth2",
-                                        "API Token",
-                                        "mTLS",
-                                    ]:
-                                        if a == known:
-                                            st.session_state[
-                                                f"collector_auth_{known}"
-                                            ] = True
-                                            break
-                                    else:
-                                        st.session_state[
-                                            "collector_auth_other_enable"
-                                        ] = True
-                                        st.session_state["collector_auth_other"] = a
-                                for h in col_sel.get("handling", []) or []:
-                                    for known in [
-                                        "None",
-                                        "Rate limiting",
-                                        "Retries",
-                                        "Exponential backoff",
-                                        "Buffering/Queue",
-                                    ]:
-                                        if h == known:
-                                            st.session_state[
-                                                f"collector_handle_{known}"
-                                            ] = True
-                                            break
-                                    else:
-                                        st.session_state[
-                                            "collector_handling_other_enable"
-                                        ] = True
-                                        st.session_state["collector_handling_other"] = h
-                                for n in col_sel.get("normalization", []) or []:
-                                    for known in [
-                                        "None",
-                                        "Timestamping",
-                                        "Tagging/labels",
-                                        "Topology enrichment",
-                                        "Schema mapping",
-                                    ]:
-                                        if n == known:
-                                            st.session_state[
-                                                f"collector_norm_{known}"
-                                            ] = True
-                                            break
-                                    else:
-                                        st.session_state[
-                                            "collector_norm_other_enable"
-                                        ] = True
-                                        st.session_state["collector_norm_other"] = n
-                                for t in col_sel.get("tools", []) or []:
-                                    for known in [
-                                        "None",
-                                        "SuzieQ",
-                                        "Cisco Catalyst Center",
-                                        "Cisco Nexus Dashboard",
-                                        "Cisco ACI APIC",
-                                        "Arista CVP",
-                                        "Prometheus",
-                                    ]:
-                                        if t == known:
-                                            st.session_state[
-                                                f"collection_tool_{known}"
-                                            ] = True
-                                            break
-                                    else:
-                                        st.session_state[
-                                            "collection_tools_other_enable"
-                                        ] = True
-                                        st.session_state["collection_tools_other"] = t
-                                if col_sel.get("devices") is not None:
-                                    st.session_state["collector_devices"] = str(
-                                        col_sel.get("devices")
-                                    )
-                                if col_sel.get("metrics_per_sec") is not None:
-                                    st.session_state["collector_metrics"] = str(
-                                        col_sel.get("metrics_per_sec")
-                                    )
-                                if col_sel.get("cadence") is not None:
-                                    st.session_state["collector_cadence"] = str(
-                                        col_sel.get("cadence")
-                                    )
-
-                                # Executor
-                                exec_sel = (data.get("executor", {}) or {}).get(
-                                    "selections", {}
-                                )
-                                exec_opts = [
-                                    "Automating CLI interaction with Python automation frameworks (Netmiko, Napalm, Nornir, PyATS)",
-                                    "Automating execution with a tool like Ansible",
-                                    "Custom Python scripts",
-                                    "Via manufacturer management application (Cisco DNA Center, Arista CVP)",
-                                ]
-                                for m in exec_sel.get("methods", []) or []:
-                                    for i, known in enumerate(exec_opts):
-                                        if m == known:
-                                            st.session_state[f"exec_{i}"] = True
-                                            break
-                                    else:
-                                        # Custom executor method
-                                        st.session_state["exec_custom_enable"] = True
-                                        st.session_state["exec_custom_text"] = m
-
-                                # Dependencies
-                                dep_list = data.get("dependencies", []) or []
-                                label_to_key = {
-                                    "Network Infrastructure": "network_infra",
-                                    "Network Controllers": "network_controllers",
-                                    "Revision Control system": "revision_control",
-                                    "ITSM/Change Management System": "itsm",
-                                    "Authentication System": "authn",
-                                    "IPAMS Systems": "ipams",
-                                    "Inventory Systems": "inventory",
-                                    "Design Data/Intent Systems": "design_intent",
-                                    "Observability System": "observability",
-                                    "Vendor Tool/Management System": "vendor_mgmt",
-                                }
-                                for d in dep_list:
-                                    lbl = (d or {}).get("name")
-                                    details = (d or {}).get("details", "")
-                                    key = label_to_key.get(lbl)
-                                    if key:
-                                        st.session_state[f"dep_{key}"] = True
-                                        if details:
-                                            st.session_state[f"dep_{key}_details"] = (
-                                                details
-                                            )
-
-                                # Timeline basics
-                                tl = data.get("timeline", {}) or {}
-                                if tl.get("staff_count") is not None:
-                                    st.session_state["timeline_staff_count"] = int(
-                                        tl.get("staff_count") or 0
-                                    )
-                                    st.session_state["_timeline_staff_count"] = int(
-                                        tl.get("staff_count") or 0
-                                    )
-                                if tl.get("staffing_plan_md") is not None:
-                                    st.session_state["timeline_staffing_plan"] = tl.get(
-                                        "staffing_plan_md"
-                                    )
-                                    st.session_state["_timeline_staffing_plan"] = tl.get(
-                                        "staffing_plan_md"
-                                    )
-                                if tl.get("holiday_region") is not None:
-                                    st.session_state["timeline_holiday_region"] = (
-                                        tl.get("holiday_region") or "None"
-                                    )
-                                    st.session_state["_timeline_holiday_region"] = (
-                                        tl.get("holiday_region") or "None"
-                                    )
-                                if tl.get("start_date"):
-                                    parsed = None
-                                    try:
-                                        parsed = datetime.datetime.strptime(
-                                            str(tl.get("start_date")), "%Y-%m-%d"
-                                        ).date()
-                                    except Exception:
-                                        try:
-                                            parsed = datetime.datetime.fromisoformat(
-                                                str(tl.get("start_date"))
-                                            ).date()
-                                        except Exception:
-                                            parsed = None
-                                    if parsed is not None:
-                                        st.session_state["timeline_start_date"] = parsed
-                                        st.session_state["_timeline_start_date_input"] = parsed
-
-                                # Timeline milestones from items
-                                items = tl.get("items") or []
-                                if isinstance(items, list) and items:
-                                    # Clear existing row-level timeline widget keys so widgets adopt new values
-                                    for k in list(st.session_state.keys()):
-                                        if k.startswith(("_tl_name_", "_tl_duration_", "_tl_notes_", "_tl_del_")):
-                                            st.session_state.pop(k, None)
-                                    ms = []
-                                    for it in items:
-                                        try:
-                                            nm = str(
-                                                (it or {}).get("name") or ""
-                                            ).strip()
-                                            dur = int(
-                                                (it or {}).get("duration_bd") or 0
-                                            )
-                                            notes = str((it or {}).get("notes") or "")
-                                        except Exception:
-                                            nm, dur, notes = (
-                                                str((it or {}).get("name") or ""),
-                                                0,
-                                                str((it or {}).get("notes") or ""),
-                                            )
-                                        ms.append(
-                                            {
-                                                "name": nm,
-                                                "duration": dur,
-                                                "notes": notes,
-                                            }
-                                        )
-                                    if ms:
-                                        st.session_state["timeline_milestones"] = ms
-                                        # Seed row-level widget keys to reflect uploaded values
-                                        for i, r in enumerate(ms):
-                                            st.session_state[f"_tl_name_{i}"] = r.get("name", "")
-                                            st.session_state[f"_tl_duration_{i}"] = int(r.get("duration", 0))
-                                            st.session_state[f"_tl_notes_{i}"] = r.get("notes", "")
-
-                                st.success(
-                                    "Applied uploaded JSON to this session. Widgets will reflect values now."
-                                )
-                                st.rerun()
-
-                        except Exception as e:
-                            st.error(f"Failed to load JSON: {e}")
+    # Colors for main content separators
+    hr_color_dict = _HR_COLORS
+
+    # JSON upload/reset controls now live in the main page body
+    _render_json_loader()
 
     #--------------- END of SIDEBAR -----------------
 
@@ -947,7 +1750,7 @@ def solution_wizard_main():
     # Title with NAF icon
     title_cols = st.columns([0.08, 0.92])
     with title_cols[0]:
-        st.image("images/naf_icon.png", width="stretch")
+        st.image(_image_bytes("images/naf_icon.png"), width="stretch")
     with title_cols[1]:
         st.markdown("**Network Automation Forum's Network Automation Framework**")
 
@@ -955,7 +1758,7 @@ def solution_wizard_main():
     col_img, col_text = st.columns([1, 1])
     with col_img:
         st.image(
-            "images/naf_arch_framework_figure.png",
+            _image_bytes("images/naf_arch_framework_figure.png"),
             width="stretch",
         )
         st.caption(
@@ -987,17 +1790,9 @@ def solution_wizard_main():
 
         Populates payload.my_role and is used to gate exporting and highlights visibility.
         """
-        SENTINEL_SELECT = "— Select one —"
         # Q1: Who’s filling out this wizard?
         st.subheader("Who’s filling out this wizard?")
-        role_opts = [
-            SENTINEL_SELECT,
-            "I’m a network engineer.",
-            "I’m a security engineer.",
-            "I’m a software developer.",
-            "I manage technical projects or teams.",
-            "Other (fill in)",
-        ]
+        role_opts = _ROLE_WHO_OPTIONS
         role_choice = st.radio(
             "Select one",
             role_opts,
@@ -1010,13 +1805,7 @@ def solution_wizard_main():
 
         # Q2: What best describes your technical skills?
         st.subheader("What best describes your technical skills?")
-        skill_opts = [
-            SENTINEL_SELECT,
-            "I have some scripting skills and basic software development experience.",
-            "I am an advanced software developer.",
-            "I provide techncial management on network and automation projects.",
-            "Other (fill in)",
-        ]
+        skill_opts = _ROLE_SKILL_OPTIONS
         skill_choice = st.radio(
             "Select one",
             skill_opts,
@@ -1029,13 +1818,7 @@ def solution_wizard_main():
 
         # Q3: Who will actually develop the network automation?
         st.subheader("Who will actually develop the network automation?")
-        dev_opts = [
-            SENTINEL_SELECT,
-            "I’ll do it myself.",
-            "My in-house team and I will build it.",
-            "We will have outside experts build it, but I’ll provide technical oversight.",
-            "Other (fill in)",
-        ]
+        dev_opts = _ROLE_DEV_OPTIONS
         dev_choice = st.radio(
             "Select one",
             dev_opts,
@@ -1046,17 +1829,10 @@ def solution_wizard_main():
         if dev_choice == "Other (fill in)":
             dev_other = st.text_input("Please describe", key="my_role_dev_other")
 
-        def _norm(choice, other):
-            if choice == "Other (fill in)":
-                return (other or "").strip()
-            if choice == SENTINEL_SELECT:
-                return ""
-            return choice or ""
-
         payload["my_role"] = {
-            "who": _norm(role_choice, role_other),
-            "skills": _norm(skill_choice, skill_other),
-            "developer": _norm(dev_choice, dev_other),
+            "who": _role_answer(role_choice, role_other),
+            "skills": _role_answer(skill_choice, skill_other),
+            "developer": _role_answer(dev_choice, dev_other),
         }
 
     # Automation Project Title & Short Description (shared with Business Case page)
@@ -1068,18 +1844,10 @@ def solution_wizard_main():
         )
         # Initialize defaults - use _wizard_ keys directly as widget keys
         # When JSON is uploaded, these keys are cleared and reset, so widgets pick up new values
-        if "_wizard_automation_title" not in st.session_state:
-            st.session_state["_wizard_automation_title"] = "My new network automation project"
-        if "_wizard_automation_description" not in st.session_state:
-            st.session_state["_wizard_automation_description"] = (
-                "Here is a short description of my my new network automation project"
-            )
-        if "_wizard_expected_use" not in st.session_state:
-            st.session_state["_wizard_expected_use"] = (
-                "This automation will be used whenever this task needs to be executed. See Use Cases for more details."
-            )
-        if "_wizard_out_of_scope" not in st.session_state:
-            st.session_state["_wizard_out_of_scope"] = ""
+        ss = st.session_state
+        for k, v in _INITIATIVE_DEFAULTS.items():
+            if k not in ss:
+                ss[k] = v
 
         col_ib1, col_ib2 = st.columns([2, 3])
         with col_ib1:
@@ -1109,22 +1877,14 @@ def solution_wizard_main():
         )
 
         # Standard reasons multiselect (required)
-        standard_reasons = [
-            "We are not improving the way our customers interact with us for service provisioning",
-            "We are not improving the speed and quality of our service provisioning",
-            "We are not meeting feature or service demands from our customers",
-            "We will continue to pay for 3rd party support for this task",
-            "This task will continue to be executed individually in an inconsistent and ad-hoc manner with varying degrees of success and documentation",
-            "This task will continue to take far longer than it should resulting in poor customer satisfaction",
-        ]
 
         # Initialize default if not set (widget key is set directly during JSON upload)
-        if "no_move_forward_reasons" not in st.session_state:
-            st.session_state["no_move_forward_reasons"] = []
+        if "no_move_forward_reasons" not in ss:
+            ss["no_move_forward_reasons"] = []
 
         no_move_forward_reasons = st.multiselect(
             "Standard reasons",
-            options=standard_reasons,
+            options=_NO_MOVE_FORWARD_REASONS,
             key="no_move_forward_reasons",
             help="Select at least one standard reason that applies.",
         )
@@ -1133,7 +1893,7 @@ def solution_wizard_main():
         if not no_move_forward_reasons:
             st.warning("Please select at least one standard reason.")
 
-        no_move_default = st.session_state.get("no_move_forward", "")
+        no_move_default = ss.get("no_move_forward", "")
         no_move_forward = st.text_area(
             "Additional risks in not moving forward (optional)",
             value=str(no_move_default),
@@ -1142,10 +1902,10 @@ def solution_wizard_main():
         )
 
         payload["initiative"] = {
-            "title": st.session_state.get("_wizard_automation_title", ""),
-            "description": st.session_state.get("_wizard_automation_description", ""),
-            "expected_use": st.session_state.get("_wizard_expected_use", ""),
-            "out_of_scope": st.session_state.get("_wizard_out_of_scope", ""),
+            "title": ss.get("_wizard_automation_title", ""),
+            "description": ss.get("_wizard_automation_description", ""),
+            "expected_use": ss.get("_wizard_expected_use", ""),
+            "out_of_scope": ss.get("_wizard_out_of_scope", ""),
             "no_move_forward": no_move_forward,
             "no_move_forward_reasons": no_move_forward_reasons,
         }
@@ -1202,19 +1962,8 @@ def solution_wizard_main():
         )
         st.subheader("Intended users")
         cols = st.columns(3)
-        user_opts = [
-            "Network Engineers",
-            "IT",
-            "Operations",
-            "Help Desk",
-            "Other IT Organizations",
-            "Any User",
-            "Authorized Users",
-        ]
-        user_checks = {}
-        for i, opt in enumerate(user_opts):
-            with cols[i % 3]:
-                user_checks[opt] = st.checkbox(opt, key=f"pres_user_{opt}")
+        user_opts = _PRES_USER_OPTIONS
+        selected_users = _checkbox_grid(user_opts, "pres_user_", cols)
         with cols[0]:
             custom_users_enabled = st.checkbox(
                 "Custom (fill in)", key="pres_user_custom_enable"
@@ -1225,11 +1974,8 @@ def solution_wizard_main():
 
         st.subheader("How will your users interact with your solution?")
         cols2 = st.columns(3)
-        interact_opts = ["CLI", "Web GUI", "Other GUI", "API"]
-        interact_checks = {}
-        for i, opt in enumerate(interact_opts):
-            with cols2[i % 3]:
-                interact_checks[opt] = st.checkbox(opt, key=f"pres_interact_{opt}")
+        interact_opts = _PRES_INTERACT_OPTIONS
+        selected_interactions = _checkbox_grid(interact_opts, "pres_interact_", cols2)
         with cols2[0]:
             custom_interact_enabled = st.checkbox(
                 "Custom (fill in)", key="pres_interact_custom_enable"
@@ -1242,19 +1988,8 @@ def solution_wizard_main():
 
         st.subheader("What tools will the Presentation layer use?")
         cols3 = st.columns(3)
-        tool_opts = [
-            "Python",
-            "Python Web Framework (Streamlit, Flask, etc.)",
-            "General Web Framework",
-            "Automation Framework",
-            "REST API",
-            "GraphQL API",
-            "Custom API",
-        ]
-        tool_checks = {}
-        for i, opt in enumerate(tool_opts):
-            with cols3[i % 3]:
-                tool_checks[opt] = st.checkbox(opt, key=f"pres_tool_{opt}")
+        tool_opts = _PRES_TOOL_OPTIONS
+        selected_tools = _checkbox_grid(tool_opts, "pres_tool_", cols3)
         with cols3[0]:
             custom_tool_enabled = st.checkbox(
                 "Custom (fill in)", key="pres_tool_custom_enable"
@@ -1265,16 +2000,8 @@ def solution_wizard_main():
 
         st.subheader("How will your users authenticate?")
         cols4 = st.columns(2)
-        auth_opts_pres = [
-            "No Authentication (suitable only for demos and very specific use cases)",
-            "Repository authorization/sharing",
-            "Built-in (to the automation) Authentication via Username/Password or TOKEN",
-            "Custom Authentication to external system (AD, SSH Keys, OAUTH2)",
-        ]
-        auth_checks_pres = {}
-        for i, opt in enumerate(auth_opts_pres):
-            with cols4[i % 2]:
-                auth_checks_pres[opt] = st.checkbox(opt, key=f"pres_auth_{opt}")
+        auth_opts_pres = _PRES_AUTH_OPTIONS
+        selected_auth_pres = _checkbox_grid(auth_opts_pres, "pres_auth_", cols4)
         with cols4[0]:
             auth_other_enabled = st.checkbox(
                 "Other (fill in details)", key="pres_auth_other_enable"
@@ -1286,19 +2013,15 @@ def solution_wizard_main():
                 )
 
         # Narrative synthesis
-        selected_users = [k for k, v in user_checks.items() if v]
         if custom_users_enabled and custom_users.strip():
             selected_users.append(custom_users.strip())
 
-        selected_interactions = [k for k, v in interact_checks.items() if v]
         if custom_interact_enabled and custom_interact.strip():
             selected_interactions.append(custom_interact.strip())
 
-        selected_tools = [k for k, v in tool_checks.items() if v]
         if custom_tool_enabled and custom_tool.strip():
             selected_tools.append(custom_tool.strip())
 
-        selected_auth_pres = [k for k, v in auth_checks_pres.items() if v]
         if auth_other_enabled and auth_other.strip():
             selected_auth_pres.append(auth_other.strip())
 
@@ -1313,29 +2036,25 @@ def solution_wizard_main():
             f"Presentation authentication will use {_join(selected_auth_pres)}."
         )
 
-        thick_hr(color="#6785a0", thickness=3)
-        st.markdown("**Preview Solution Highlights**")
         any_selected = bool(
             selected_users
             or selected_interactions
             or selected_tools
             or selected_auth_pres
         )
-        if not any_selected:
-            st.info(
-                "Make selections above to see highlights for the Presentation section."
-            )
-        else:
-            st.markdown(
-                "\n".join(
-                    [
-                        f"- {users_sentence}",
-                        f"- {interaction_sentence}",
-                        f"- {tools_sentence}",
-                        f"- {auth_sentence_pres}",
-                    ]
+        _render_preview(
+            (
+                (
+                    users_sentence,
+                    interaction_sentence,
+                    tools_sentence,
+                    auth_sentence_pres,
                 )
-            )
+                if any_selected
+                else ()
+            ),
+            "Make selections above to see highlights for the Presentation section.",
+        )
 
         payload["presentation"] = {
             "users": users_sentence,
@@ -1371,22 +2090,8 @@ def solution_wizard_main():
         )
         st.subheader("How will Intent be developed?")
         cols = st.columns(3)
-        intent_dev_opts = [
-            "Templates",
-            "Policies",
-            "Service Profiles",
-            "Model-driven (data models)",
-            "Declarative (YAML/JSON)",
-            "Forms/GUI",
-            "Domain-specific language (DSL)",
-            "GitOps workflow (PRs/Reviews)",
-            "API-driven",
-            "Import from Source of Truth (CMDB/IPAM/Inventory/Git)",
-        ]
-        intent_checks = {}
-        for i, opt in enumerate(intent_dev_opts):
-            with cols[i % 3]:
-                intent_checks[opt] = st.checkbox(opt, key=f"intent_dev_{opt}")
+        intent_dev_opts = _INTENT_DEV_OPTIONS
+        selected_intent_devs = _checkbox_grid(intent_dev_opts, "intent_dev_", cols)
         intent_custom_enabled = st.checkbox(
             "Custom (fill in)", key="intent_dev_custom_enable"
         )
@@ -1399,17 +2104,8 @@ def solution_wizard_main():
         # How will intent be consumed by automation?
         st.subheader("How will intent be consumed by automation?")
         cols_p = st.columns(3)
-        intent_prov_opts = [
-            "Text file",
-            "Serialized format (JSON, YAML)",
-            "CSV",
-            "Excel",
-            "API",
-        ]
-        intent_prov_checks = {}
-        for i, opt in enumerate(intent_prov_opts):
-            with cols_p[i % 3]:
-                intent_prov_checks[opt] = st.checkbox(opt, key=f"intent_prov_{opt}")
+        intent_prov_opts = _INTENT_PROV_OPTIONS
+        selected_intent_prov = _checkbox_grid(intent_prov_opts, "intent_prov_", cols_p)
         with cols_p[0]:
             intent_prov_custom_enabled = st.checkbox(
                 "Custom (fill in)", key="intent_prov_custom_enable"
@@ -1421,11 +2117,9 @@ def solution_wizard_main():
                 )
 
         # Narrative synthesis (Intent)
-        selected_intent_devs = [k for k, v in intent_checks.items() if v]
         if intent_custom_enabled and intent_custom.strip():
             selected_intent_devs.append(intent_custom.strip())
 
-        selected_intent_prov = [k for k, v in intent_prov_checks.items() if v]
         if intent_prov_custom_enabled and intent_prov_custom.strip():
             selected_intent_prov.append(intent_prov_custom.strip())
 
@@ -1436,20 +2130,11 @@ def solution_wizard_main():
             f"Intent will be provided via {_join(selected_intent_prov)}."
         )
 
-        thick_hr(color="#6785a0", thickness=3)
-        st.markdown("**Preview Solution Highlights**")
         any_selected_intent = bool(selected_intent_devs or selected_intent_prov)
-        if not any_selected_intent:
-            st.info("Make selections above to see highlights for the Intent section.")
-        else:
-            st.markdown(
-                "\n".join(
-                    [
-                        f"- {intent_sentence}",
-                        f"- {intent_provided_sentence}",
-                    ]
-                )
-            )
+        _render_preview(
+            (intent_sentence, intent_provided_sentence) if any_selected_intent else (),
+            "Make selections above to see highlights for the Intent section.",
+        )
 
         payload["intent"] = {
             "development": intent_sentence,
@@ -1475,15 +2160,8 @@ def solution_wizard_main():
         )
         st.subheader("How will you determine network state?")
         cols_obs = st.columns(3)
-        state_methods_opts = [
-            "Manual",
-            "Purpose-built Python Script",
-            "API call",
-        ]
-        state_methods_checks = {}
-        for i, opt in enumerate(state_methods_opts):
-            with cols_obs[i % 3]:
-                state_methods_checks[opt] = st.checkbox(opt, key=f"obs_state_{opt}")
+        state_methods_opts = _OBS_STATE_OPTIONS
+        selected_methods = _checkbox_grid(state_methods_opts, "obs_state_", cols_obs)
 
         st.subheader("Describe the basic go/no go logic")
         go_no_go_text = st.text_area(
@@ -1509,32 +2187,17 @@ def solution_wizard_main():
 
         st.subheader("What tools will be used to support the observability layer?")
         cols_tools = st.columns(3)
-        obs_tools_opts = [
-            "SuzieQ Open Source",
-            "SuzieQ Enterprise",
-            "Network Vendor Product (Cisco Catalyst Center, Arista CVP, etc.)",
-            "Custom Python Scripts",
-        ]
-        obs_tools_checks = {}
-        for i, opt in enumerate(obs_tools_opts):
-            with cols_tools[i % 3]:
-                obs_tools_checks[opt] = st.checkbox(opt, key=f"obs_tool_{opt}")
-        obs_tools_other_enabled = st.checkbox(
-            "Other (fill in)", key="obs_tool_other_enable"
-        )
-        obs_tools_other = ""
-        if obs_tools_other_enabled:
-            obs_tools_other = st.text_input(
-                "Other observability tool(s)", key="obs_tool_other_text"
-            )
-
-        # Compile selected observability tools before narrative
-        selected_tools_obs = [k for k, v in obs_tools_checks.items() if v]
-        if obs_tools_other_enabled and (obs_tools_other or "").strip():
-            selected_tools_obs.append(obs_tools_other.strip())
+        obs_tools_opts = _OBS_TOOL_OPTIONS
+        selected_tools_obs = _checkbox_group(
+            obs_tools_opts,
+            "obs_tool_",
+            cols_tools,
+            "obs_tool_other_enable",
+            "obs_tool_other_text",
+            "Other observability tool(s)",
+        )
 
         # Build method and go/no-go narratives
-        selected_methods = [k for k, v in state_methods_checks.items() if v]
         methods_sentence = (
             f"Network state will be determined via {_join(selected_methods)}."
         )
@@ -1552,23 +2215,19 @@ def solution_wizard_main():
             f"Observability will be supported by {_join(selected_tools_obs)}."
         )
 
-        thick_hr(color="#6785a0", thickness=3)
-        st.markdown("**Preview Solution Highlights**")
         lines = []
         if selected_methods:
-            lines.append(f"- {methods_sentence}")
+            lines.append(methods_sentence)
         if (go_no_go_text or "").strip():
-            lines.append(f"- {go_no_go_sentence}")
+            lines.append(go_no_go_sentence)
         if add_logic_choice == "Yes" and (add_logic_text or "").strip():
-            lines.append(f"- {additional_logic_sentence}")
+            lines.append(additional_logic_sentence)
         if selected_tools_obs:
-            lines.append(f"- {tools_sentence_obs}")
-        if not lines:
-            st.info(
-                "Make selections above to see highlights for the Observability section."
-            )
-        else:
-            st.markdown("\n".join(lines))
+            lines.append(tools_sentence_obs)
+        _render_preview(
+            lines,
+            "Make selections above to see highlights for the Observability section.",
+        )
 
         payload["observability"] = {
             "methods": methods_sentence,
@@ -1607,17 +2266,8 @@ def solution_wizard_main():
 
         st.subheader("Will the solution utilize orchestration?")
 
-        ORCH_SENTINEL = "— Select one —"
-        _orch_options = [
-            ORCH_SENTINEL,
-            "No",
-            "Yes – internal via custom scripts and logic",
-            "Yes – provide details",
-        ]
-        _orch_prev = st.session_state.get("orch_choice")
-        _orch_index = (
-            _orch_options.index(_orch_prev) if _orch_prev in _orch_options else 0
-        )
+        _orch_options = _ORCH_OPTIONS
+        _orch_index = _ORCH_INDEX.get(st.session_state.get("orch_choice"), 0)
         orch_choice = st.radio(
             "Select an option",
             _orch_options,
@@ -1635,32 +2285,17 @@ def solution_wizard_main():
             )
 
         # Narrative synthesis
-        if orch_choice == ORCH_SENTINEL:
-            orch_sentence = ""
-        elif orch_choice == "No":
-            # Render a proper bullet for 'No'
-            orch_sentence = "No Orchestration will be used in this project."
-        elif orch_choice == "Yes – internal via custom scripts and logic":
-            orch_sentence = "Orchestration will be implemented internally using custom scripts and logic to coordinate end-to-end workflows."
-        elif orch_choice == "Yes – provide details":
+        if orch_choice == "Yes – provide details":
             orch_sentence = (
                 f"Orchestration will be utilized: {orch_details.strip() or 'TBD'}."
             )
         else:
-            orch_sentence = ""
+            orch_sentence = _ORCH_SENTENCES.get(orch_choice, "")
 
-        thick_hr(color="#6785a0", thickness=3)
-        st.markdown("**Preview Solution Highlights**")
-        if orch_choice == ORCH_SENTINEL:
-            st.info(
-                "Make selections above to see highlights for the Orchestration section."
-            )
-        else:
-            _orch_lines = []
-            if orch_sentence.strip():
-                _orch_lines.append(f"- {orch_sentence}")
-            if _orch_lines:
-                st.markdown("\n".join(_orch_lines))
+        _render_preview(
+            (orch_sentence,),
+            "Make selections above to see highlights for the Orchestration section.",
+        )
 
         payload["orchestration"] = {
             "summary": orch_sentence,
@@ -1686,88 +2321,51 @@ def solution_wizard_main():
         st.subheader("Collection methods (protocols/APIs)")
         st.caption("Build your own approaches (protocols, handling, normalization)")
         cols_c1 = st.columns(3)
-        collect_method_opts = [
-            "SNMP",
-            "CLI/SSH",
-            "NETCONF",
-            "gNMI",
-            "REST API",
-            "Webhooks",
-            "Syslog",
-            "Streaming Telemetry",
-        ]
-        collect_checks = {}
-        for i, opt in enumerate(collect_method_opts):
-            with cols_c1[i % 3]:
-                collect_checks[opt] = st.checkbox(opt, key=f"collector_method_{opt}")
-        methods_other_enable = st.checkbox(
-            "Other (fill in)", key="collector_methods_other_enable"
-        )
-        methods_other_text = ""
-        if methods_other_enable:
-            methods_other_text = st.text_input(
-                "Other protocol/API", key="collector_methods_other"
-            )
+        collect_method_opts = _COLLECTOR_METHOD_OPTIONS
+        selected_methods = _checkbox_group(
+            collect_method_opts,
+            "collector_method_",
+            cols_c1,
+            "collector_methods_other_enable",
+            "collector_methods_other",
+            "Other protocol/API",
+        )
 
         st.subheader("Authentication")
         cols_c2 = st.columns(3)
-        auth_opts = ["Username/Password", "SSH Keys", "OAuth2", "API Token", "mTLS"]
-        auth_checks = {}
-        for i, opt in enumerate(auth_opts):
-            with cols_c2[i % 3]:
-                auth_checks[opt] = st.checkbox(opt, key=f"collector_auth_{opt}")
-        auth_other_enable = st.checkbox(
-            "Other (fill in)", key="collector_auth_other_enable"
-        )
-        auth_other_text = ""
-        if auth_other_enable:
-            auth_other_text = st.text_input(
-                "Other authentication method(s)", key="collector_auth_other"
-            )
+        auth_opts = _COLLECTOR_AUTH_OPTIONS
+        selected_auth = _checkbox_group(
+            auth_opts,
+            "collector_auth_",
+            cols_c2,
+            "collector_auth_other_enable",
+            "collector_auth_other",
+            "Other authentication method(s)",
+        )
 
         st.subheader("Traffic handling")
         cols_c3 = st.columns(3)
-        handling_opts = [
-            "None",
-            "Rate limiting",
-            "Retries",
-            "Exponential backoff",
-            "Buffering/Queue",
-        ]
-        handling_checks = {}
-        for i, opt in enumerate(handling_opts):
-            with cols_c3[i % 3]:
-                handling_checks[opt] = st.checkbox(opt, key=f"collector_handle_{opt}")
-        handling_other_enable = st.checkbox(
-            "Other (fill in)", key="collector_handling_other_enable"
-        )
-        handling_other_text = ""
-        if handling_other_enable:
-            handling_other_text = st.text_input(
-                "Other traffic handling approach(es)", key="collector_handling_other"
-            )
+        handling_opts = _COLLECTOR_HANDLING_OPTIONS
+        selected_handling = _checkbox_group(
+            handling_opts,
+            "collector_handle_",
+            cols_c3,
+            "collector_handling_other_enable",
+            "collector_handling_other",
+            "Other traffic handling approach(es)",
+        )
 
         st.subheader("Normalization and schemas")
         cols_c4 = st.columns(3)
-        norm_opts = [
-            "None",
-            "Timestamping",
-            "Tagging/labels",
-            "Topology enrichment",
-            "Schema mapping",
-        ]
-        norm_checks = {}
-        for i, opt in enumerate(norm_opts):
-            with cols_c4[i % 3]:
-                norm_checks[opt] = st.checkbox(opt, key=f"collector_norm_{opt}")
-        norm_other_enable = st.checkbox(
-            "Other (fill in)", key="collector_norm_other_enable"
-        )
-        norm_other_text = ""
-        if norm_other_enable:
-            norm_other_text = st.text_input(
-                "Other normalization/schema approach(es)", key="collector_norm_other"
-            )
+        norm_opts = _COLLECTOR_NORM_OPTIONS
+        selected_norm = _checkbox_group(
+            norm_opts,
+            "collector_norm_",
+            cols_c4,
+            "collector_norm_other_enable",
+            "collector_norm_other",
+            "Other normalization/schema approach(es)",
+        )
 
         # Visual divider indicating build vs buy/use existing
         st.divider()
@@ -1779,27 +2377,15 @@ def solution_wizard_main():
         st.subheader("Collection tools")
         st.caption("Buy/use existing platforms (collection tools)")
         cols_ct = st.columns(3)
-        tool_opts = [
-            "None",
-            "SuzieQ",
-            "Cisco Catalyst Center",
-            "Cisco Nexus Dashboard",
-            "Cisco ACI APIC",
-            "Arista CVP",
-            "Prometheus",
-        ]
-        tool_checks = {}
-        for i, opt in enumerate(tool_opts):
-            with cols_ct[i % 3]:
-                tool_checks[opt] = st.checkbox(opt, key=f"collection_tool_{opt}")
-        tools_other_enable = st.checkbox(
-            "Other (fill in)", key="collection_tools_other_enable"
-        )
-        tools_other_text = ""
-        if tools_other_enable:
-            tools_other_text = st.text_input(
-                "Other collection tool(s)", key="collection_tools_other"
-            )
+        tool_opts = _COLLECTION_TOOL_OPTIONS
+        selected_tools = _checkbox_group(
+            tool_opts,
+            "collection_tool_",
+            cols_ct,
+            "collection_tools_other_enable",
+            "collection_tools_other",
+            "Other collection tool(s)",
+        )
 
         st.subheader("Expected scale")
         col_s1, col_s2, col_s3 = st.columns(3)
@@ -1825,22 +2411,6 @@ def solution_wizard_main():
                 placeholder="e.g., 30s polling; streaming realtime",
             )
 
-        selected_methods = [k for k, v in collect_checks.items() if v]
-        if methods_other_enable and (methods_other_text or "").strip():
-            selected_methods.append(methods_other_text.strip())
-        selected_auth = [k for k, v in auth_checks.items() if v]
-        if auth_other_enable and (auth_other_text or "").strip():
-            selected_auth.append(auth_other_text.strip())
-        selected_handling = [k for k, v in handling_checks.items() if v]
-        if handling_other_enable and (handling_other_text or "").strip():
-            selected_handling.append(handling_other_text.strip())
-        selected_norm = [k for k, v in norm_checks.items() if v]
-        if norm_other_enable and (norm_other_text or "").strip():
-            selected_norm.append(norm_other_text.strip())
-        selected_tools = [k for k, v in tool_checks.items() if v]
-        if tools_other_enable and (tools_other_text or "").strip():
-            selected_tools.append(tools_other_text.strip())
-
         methods_sentence = f"Collection will use {_join(selected_methods)}."
         auth_sentence = f"Authentication will leverage {_join(selected_auth)}."
         handling_sentence = f"Traffic handling will include {_join(selected_handling)}."
@@ -1848,8 +2418,6 @@ def solution_wizard_main():
         scale_sentence = f"Expected scale: ~{devices or 'TBD'} devices, ~{metrics or 'TBD'} metrics/sec, cadence {cadence or 'TBD'}."
         tools_sentence_coll = f"Collection tools will include {_join(selected_tools)}."
 
-        thick_hr(color="#6785a0", thickness=3)
-        st.markdown("**Preview Solution Highlights**")
         any_selected_coll = bool(
             selected_methods
             or selected_auth
@@ -1858,23 +2426,21 @@ def solution_wizard_main():
             or selected_tools
             or (devices or metrics or cadence)
         )
-        if not any_selected_coll:
-            st.info(
-                "Make selections above to see highlights for the Collector section."
-            )
-        else:
-            st.markdown(
-                "\n".join(
-                    [
-                        f"- {methods_sentence}",
-                        f"- {auth_sentence}",
-                        f"- {handling_sentence}",
-                        f"- {norm_sentence}",
-                        f"- {scale_sentence}",
-                        f"- {tools_sentence_coll}",
-                    ]
+        _render_preview(
+            (
+                (
+                    methods_sentence,
+                    auth_sentence,
+                    handling_sentence,
+                    norm_sentence,
+                    scale_sentence,
+                    tools_sentence_coll,
                 )
-            )
+                if any_selected_coll
+                else ()
+            ),
+            "Make selections above to see highlights for the Collector section.",
+        )
 
         payload["collector"] = {
             "methods": methods_sentence,
@@ -1912,16 +2478,12 @@ def solution_wizard_main():
         )
         st.subheader("How will your solution execute change?")
         cols_exec = st.columns(2)
-        exec_opts = [
-            "Automating CLI interaction with Python automation frameworks (Netmiko, Napalm, Nornir, PyATS)",
-            "Automating execution with a tool like Ansible",
-            "Custom Python scripts",
-            "Via manufacturer management application (Cisco DNA Center, Arista CVP)",
-        ]
-        exec_checks = {}
+        exec_opts = _EXEC_OPTIONS
+        selected_exec = []
         for i, opt in enumerate(exec_opts):
             with cols_exec[i % 2]:
-                exec_checks[opt] = st.checkbox(opt, key=f"exec_{i}")
+                if st.checkbox(opt, key=f"exec_{i}"):
+                    selected_exec.append(opt)
         with cols_exec[0]:
             exec_custom_enable = st.checkbox(
                 "Custom (describe in detail)", key="exec_custom_enable"
@@ -1932,25 +2494,15 @@ def solution_wizard_main():
                     "Custom execution approach", key="exec_custom_text"
                 )
 
-        selected_exec = [k for k, v in exec_checks.items() if v]
         if exec_custom_enable and exec_custom_text.strip():
             selected_exec.append(exec_custom_text.strip())
 
         exec_sentence = f"Execution will be performed using {_join(selected_exec)}."
 
-        thick_hr(color="#6785a0", thickness=3)
-        st.markdown("**Preview Solution Highlights**")
-        any_selected_exec = bool(selected_exec)
-        if not any_selected_exec:
-            st.info("Make selections above to see highlights for the Executor section.")
-        else:
-            st.markdown(
-                "\n".join(
-                    [
-                        f"- {exec_sentence}",
-                    ]
-                )
-            )
+        _render_preview(
+            (exec_sentence,) if selected_exec else (),
+            "Make selections above to see highlights for the Executor section.",
+        )
 
         payload["executor"] = {
             "methods": exec_sentence,
@@ -1975,104 +2527,33 @@ def solution_wizard_main():
         st.caption(
             "Select the external systems this automation will interact with and add details where applicable."
         )
-        dep_defs = [
-            {
-                "key": "network_infra",
-                "label": "Network Infrastructure",
-                "default": True,
-                "details": False,
-                "help": "The automation will act on some or all of the organization's network infrastructure (switches, appliances, routers, etc.).",
-            },
-            {
-                "key": "network_controllers",
-                "label": "Network Controllers",
-                "default": False,
-                "details": True,
-            },
-            {
-                "key": "revision_control",
-                "label": "Revision Control system",
-                "default": True,
-                "details": True,
-                "help": "e.g. GitHub, GitLab, Bitbucket",
-            },
-            {
-                "key": "itsm",
-                "label": "ITSM/Change Management System",
-                "default": False,
-                "details": True,
-            },
-            {
-                "key": "authn",
-                "label": "Authentication System",
-                "default": False,
-                "details": True,
-            },
-            {
-                "key": "ipams",
-                "label": "IPAMS Systems",
-                "default": False,
-                "details": True,
-            },
-            {
-                "key": "inventory",
-                "label": "Inventory Systems",
-                "default": False,
-                "details": True,
-                "help": "Source of truth/CMDB/inventory (e.g., NetBox, InfraHub, ServiceNow CMDB). What data do you read/write?",
-            },
-            {
-                "key": "design_intent",
-                "label": "Design Data/Intent Systems",
-                "default": False,
-                "details": True,
-                "help": "Systems holding golden intent or design models (InfraHub, Custom DB).",
-            },
-            {
-                "key": "observability",
-                "label": "Observability System",
-                "default": False,
-                "details": True,
-                "help": "Telemetry/monitoring/logs/traces (e.g., SuzieQ, Prometheus).",
-            },
-            {
-                "key": "vendor_mgmt",
-                "label": "Vendor Tool/Management System",
-                "default": False,
-                "details": True,
-                "help": "(e.g., Cisco DNAC, Wireless Controllers, Miraki, Arista CVP, Aruba Central, Juniper Apstra).",
-            },
-        ]
+        dep_defs = _DEP_DEFS
+        ss = st.session_state
 
-        deps_selected = []
+        selected_pairs = []  # (label, stripped details) per checked dependency
         for d in dep_defs:
+            label = d["label"]
+            dep_key, details_key = _DEP_STATE_KEYS[label]
             checked = st.checkbox(
-                d["label"],
-                key=f"dep_{d['key']}",
-                value=bool(
-                    st.session_state.get(f"dep_{d['key']}", d.get("default", False))
-                ),
+                label,
+                key=dep_key,
+                value=bool(ss.get(dep_key, d.get("default", False))),
                 help=d.get("help"),
             )
-            if checked and d.get("details"):
-                default_detail = d.get("default_detail", "")
-                if d["key"] == "revision_control":
-                    default_detail = "GitHub"
+            if not checked:
+                continue
+            detail_text = ""
+            if d.get("details"):
                 detail_text = st.text_input(
-                    f"Details for {d['label']}",
-                    value=str(
-                        st.session_state.get(f"dep_{d['key']}_details", default_detail)
-                    ),
-                    key=f"dep_{d['key']}_details",
-                )
-            else:
-                detail_text = ""
-            if checked:
-                deps_selected.append(
-                    {"name": d["label"], "details": (detail_text or "").strip()}
+                    f"Details for {label}",
+                    value=str(ss.get(details_key, d.get("default_detail", ""))),
+                    key=details_key,
                 )
+            selected_pairs.append((label, (detail_text or "").strip()))
 
-        payload["dependencies"] = deps_selected
+        payload["dependencies"] = [
+            {"name": name, "details": details} for name, details in selected_pairs
+        ]
 
     # Staffing, Timeline, & Milestones
     with st.expander("Staffing, Timeline, & Milestones", expanded=False):
@@ -2086,6 +2567,8 @@ def solution_wizard_main():
             "Duration should reflect expected staffing. For example, if a step is 10 business days of work but two people will work in parallel, you may model it as 5–6 days to allow for coordination overhead."
         )
 
+        ss = st.session_state
+
         st.subheader("Staffing plan")
         st.caption(
             "Provide expected direct staffing and a short plan. Markdown is supported."
@@ -2095,86 +2578,42 @@ def solution_wizard_main():
             staff_count = st.number_input(
                 "Direct staff on project",
                 min_value=0,
-                value=int(st.session_state.get("timeline_staff_count", 1)),
+                value=int(ss.get("timeline_staff_count", 1)),
                 step=1,
                 key="_timeline_staff_count",
             )
-            st.session_state["timeline_staff_count"] = int(staff_count)
+            ss["timeline_staff_count"] = int(staff_count)
         with col_sp2:
             staffing_plan = st.text_area(
                 "Staffing plan (markdown supported)",
-                value=str(st.session_state.get("timeline_staffing_plan", "")),
+                value=str(ss.get("timeline_staffing_plan", "")),
                 height=120,
                 key="_timeline_staffing_plan",
             )
-            st.session_state["timeline_staffing_plan"] = staffing_plan
+            ss["timeline_staffing_plan"] = staffing_plan
 
         # Holiday calendar selector (lightweight)
-        region_options = [
-            "None",
-            "United States",
-            "Canada",
-            "United Kingdom",
-            "Germany",
-            "India",
-            "Australia",
-        ]
+        region_options = _HOLIDAY_REGIONS
+        saved_region = ss.get("timeline_holiday_region", "None")
         holiday_region = st.selectbox(
             "Holiday calendar",
             options=region_options,
             index=region_options.index(
-                st.session_state.get("timeline_holiday_region", "None")
-                if st.session_state.get("timeline_holiday_region", "None")
-                in region_options
-                else "None"
+                saved_region if saved_region in region_options else "None"
             ),
             help="Used to skip public holidays when computing business days.",
             key="_timeline_holiday_region",
         )
-        st.session_state["timeline_holiday_region"] = holiday_region
-
-        def _build_holiday_set(start_year: int, years_ahead: int = 2):
-            if _hol is None or holiday_region == "None":
-                return set()
-            years = list(range(start_year, start_year + max(1, years_ahead) + 1))
-            cal = None
-            try:
-                if holiday_region == "United States":
-                    cal = _hol.UnitedStates(years=years)
-                elif holiday_region == "Canada":
-                    cal = _hol.Canada(years=years)
-                elif holiday_region == "United Kingdom":
-                    cal = _hol.UnitedKingdom(years=years)
-                elif holiday_region == "Germany":
-                    cal = _hol.Germany(years=years)
-                elif holiday_region == "India":
-                    cal = _hol.India(years=years)
-                elif holiday_region == "Australia":
-                    cal = _hol.Australia(years=years)
-            except Exception:
-                cal = None
-            return set(cal.keys()) if cal else set()
-
-        # Helper: add business days (Mon–Fri), with optional holidays
-        def _add_business_days(d, n, holiday_set=None):
-            days = int(n or 0)
-            cur = d
-            while days > 0:
-                cur = cur + datetime.timedelta(days=1)
-                if cur.weekday() < 5 and (
-                    holiday_set is None or cur not in holiday_set
-                ):  # Mon=0 .. Sun=6
-                    days -= 1
-            return cur
+        ss["timeline_holiday_region"] = holiday_region
 
         # Start date
-        default_start = st.session_state.get("timeline_start_date")
+        default_start = ss.get("timeline_start_date")
         start_date = st.date_input(
             "Project start date",
             value=default_start or datetime.datetime.today().date(),
             key="_timeline_start_date_input",
         )
-        st.session_state["timeline_start_date"] = start_date
+        ss["timeline_start_date"] = start_date
 
         # Milestones state
         if "timeline_milestones" not in st.session_state:
@@ -2187,83 +2626,85 @@ def solution_wizard_main():
                 {"name": "Production Rollout", "duration": 10, "notes": ""},
             ]
 
-        # Controls
-        c_a, c_b = st.columns([1, 1])
-        with c_a:
-            if st.button("Add milestone row", key="_timeline_add_row"):
-                st.session_state["timeline_milestones"].append(
-                    {"name": "", "duration": 0, "notes": ""}
-                )
-        with c_b:
-            st.caption(
-                "Use the fields below to edit milestone name, duration (business days), and notes."
-            )
+        # One editor widget for all rows. Its input is snapshotted while the
+        # editor is alive so edits aren't re-applied on top of themselves; the
+        # snapshot is refreshed from timeline_milestones after a page switch,
+        # upload or reset drops the editor state. st.data_editor needs a
+        # DataFrame, so pandas is loaded on the first run that reaches here.
+        pd = _pandas_module()
 
-        # Render rows
-        to_delete = []
-        for idx, row in enumerate(list(st.session_state["timeline_milestones"])):
-            rcols = st.columns([3, 2, 5, 1])
-            with rcols[0]:
-                row_name = st.text_input(
-                    "Milestone",
-                    value=str(row.get("name", "")),
-                    key=f"_tl_name_{idx}",
-                )
-            with rcols[1]:
-                row_duration = st.number_input(
-                    "Duration (business days)",
-                    min_value=0,
-                    value=int(row.get("duration", 0)),
-                    step=1,
-                    key=f"_tl_duration_{idx}",
-                )
-            with rcols[2]:
-                row_notes = st.text_input(
-                    "Notes/comments",
-                    value=str(row.get("notes", "")),
-                    key=f"_tl_notes_{idx}",
-                )
-            with rcols[3]:
-                del_flag = st.checkbox("Delete", key=f"_tl_del_{idx}")
-                if del_flag:
-                    to_delete.append(idx)
-
-            # Persist edits back to state
-            st.session_state["timeline_milestones"][idx] = {
-                "name": row_name,
-                "duration": int(row_duration),
-                "notes": row_notes,
-            }
+        if "_timeline_editor" not in st.session_state:
+            st.session_state["_timeline_editor_base"] = list(
+                st.session_state["timeline_milestones"]
+            )
+        edited = st.data_editor(
+            pd.DataFrame(
+                st.session_state["_timeline_editor_base"],
+                columns=["name", "duration", "notes"],
+            ),
+            num_rows="dynamic",
+            hide_index=True,
+            column_config={
+                "name": st.column_config.TextColumn("Milestone"),
+                "duration": st.column_config.NumberColumn(
+                    "Duration (business days)", min_value=0, step=1
+                ),
+                "notes": st.column_config.TextColumn("Notes/comments"),
+            },
+            key="_timeline_editor",
+            width="stretch",
+        )
+        st.caption(
+            "Edit milestone name, duration (business days), and notes in the table; add or delete rows from its toolbar."
+        )
 
-        # Apply deletions (from end to start)
-        for i in sorted(to_delete, reverse=True):
-            if 0 <= i < len(st.session_state["timeline_milestones"]):
-                st.session_state["timeline_milestones"].pop(i)
-
-        # Build schedule
-        schedule = []
-        cursor = start_date
-        holiday_set = _build_holiday_set(start_date.year, years_ahead=3)
-        total_bd = 0
-        for row in st.session_state["timeline_milestones"]:
-            name = (row.get("name") or "").strip()
-            dur = int(row.get("duration") or 0)
-            notes = row.get("notes") or ""
-            if not name and dur <= 0:
-                continue
-            start = cursor
-            end = _add_business_days(start, dur, holiday_set) if dur > 0 else start
-            schedule.append(
+        # Persist edits back to state (new rows arrive with empty cells)
+        ms = []
+        for r in edited.to_dict("records"):
+            nm, dur, notes = r.get("name"), r.get("duration"), r.get("notes")
+            ms.append(
                 {
-                    "name": name or "(Unnamed)",
-                    "duration_bd": dur,
-                    "start": start,
-                    "end": end,
-                    "notes": notes,
+                    "name": "" if pd.isna(nm) else str(nm),
+                    "duration": 0 if pd.isna(dur) else int(dur),
+                    "notes": "" if pd.isna(notes) else str(notes),
                 }
             )
-            cursor = end  # next starts after this completes
-            total_bd += max(0, dur)
+        st.session_state["timeline_milestones"] = ms
+
+        # Build schedule (reused across reruns until an input changes)
+        sched_key = (
+            start_date,
+            holiday_region,
+            tuple((r.get("name"), r.get("duration"), r.get("notes")) for r in ms),
+        )
+        if st.session_state.get("_timeline_sched_key") == sched_key:
+            schedule, total_bd = st.session_state["_timeline_sched_val"]
+        else:
+            schedule = []
+            cursor = start_date
+            holiday_set = _build_holiday_set(holiday_region, start_date.year, 3)
+            total_bd = 0
+            for row in ms:
+                name = (row.get("name") or "").strip()
+                dur = int(row.get("duration") or 0)
+                notes = row.get("notes") or ""
+                if not name and dur <= 0:
+                    continue
+                start = cursor
+                end = _add_business_days(start, dur, holiday_set) if dur > 0 else start
+                schedule.append(
+                    {
+                        "name": name or "(Unnamed)",
+                        "duration_bd": dur,
+                        "start": start,
+                        "end": end,
+                        "notes": notes,
+                    }
+                )
+                cursor = end  # next starts after this completes
+                total_bd += max(0, dur)
+            st.session_state["_timeline_sched_key"] = sched_key
+            st.session_state["_timeline_sched_val"] = (schedule, total_bd)
 
         # Summary & display
         if schedule:
@@ -2294,33 +2735,16 @@ def solution_wizard_main():
                 "Show Gantt chart", value=True, key="_timeline_show_chart"
             )
             if show_chart:
-                df = pd.DataFrame(
-                    [
-                        {
-                            "Task": it["name"],
-                            "Start": it["start"],
-                            "Finish": it["end"],
-                            "Duration (bd)": it["duration_bd"],
-                        }
-                        for it in schedule
-                    ]
+                sched_key = tuple(
+                    (it["name"], it["start"], it["end"], it["duration_bd"])
+                    for it in schedule
                 )
-                if not df.empty:
-                    fig = px.timeline(
-                        df,
-                        x_start="Start",
-                        x_end="Finish",
-                        y="Task",
-                        color="Task",
-                        color_discrete_sequence=px.colors.qualitative.Set3,
-                    )
-                    fig.update_yaxes(autorange="reversed")  # earliest at top
-                    fig.update_layout(height=380, margin=dict(l=0, r=0, t=30, b=0))
+                fig, gantt_html = _gantt_chart(sched_key)
+                if fig is not None:
                     st.plotly_chart(fig, width="stretch")
 
                     # Offer download of the Gantt chart as a standalone HTML file
-                    gantt_html = fig.to_html(full_html=True, include_plotlyjs="cdn")
-                    gantt_fname = f"WizardTimeline_{datetime.datetime.utcnow().strftime('%Y%m%d_%H%M%S')}Z.html"
+                    gantt_fname = f"WizardTimeline_{_fmt_ts(datetime.datetime.now(datetime.timezone.utc))}Z.html"
                     dl_clicked = st.download_button(
                         label="Download Gantt chart (HTML)",
                         data=gantt_html,
@@ -2339,8 +2763,8 @@ def solution_wizard_main():
             "projected_completion": (
                 schedule[-1]["end"].strftime("%Y-%m-%d") if schedule else None
             ),
-            "staff_count": int(st.session_state.get("timeline_staff_count", 0)),
-            "staffing_plan_md": st.session_state.get("timeline_staffing_plan", ""),
+            "staff_count": int(staff_count),
+            "staffing_plan_md": staffing_plan,
             "holiday_region": holiday_region,
             "items": [
                 {
@@ -2371,213 +2795,49 @@ def solution_wizard_main():
                 name = (uc.get("name") or "").strip() or "(Untitled)"
                 st.markdown(f"- Use Case {i}: {name}")
 
-    # Local payload compiled above
-    # Determine if there is meaningful content across sections (the user has made updates
-    def _has_any_content(p: dict) -> bool:
-        try:
-            # Prefer narrative strings, which include 'TBD' for empties and are filtered by is_meaningful
-            pres_narr = p.get("presentation", {}) or {}
-            intent_narr = p.get("intent", {}) or {}
-            obs_narr = p.get("observability", {}) or {}
-            orch_narr = p.get("orchestration", {}) or {}
-            coll_narr = p.get("collector", {}) or {}
-            exec_narr = p.get("executor", {}) or {}
-            deps = p.get("dependencies", []) or []
-            tl = p.get("timeline", {}) or {}
-            ini = p.get("initiative", {}) or {}
-            my_role = p.get("my_role", {}) or {}
-
-            # Narrative-based flags (suppressed when 'TBD' or placeholder text)
-            pres_flag = any(
-                is_meaningful(pres_narr.get(k))
-                for k in ("users", "interaction", "tools", "auth")
-            )
-            intent_flag = any(
-                is_meaningful(intent_narr.get(k)) for k in ("development", "provided")
-            )
-            obs_flag = any(
-                is_meaningful(obs_narr.get(k))
-                for k in ("methods", "go_no_go", "additional_logic", "tools")
-            )
-            _orch_sel = (
-                (orch_narr.get("selections") or {})
-                if isinstance(orch_narr, dict)
-                else {}
-            )
-            _orch_choice = (_orch_sel.get("choice") or "").strip()
-            # Count any non-sentinel choice (including 'No') as content for gating exports
-            orch_flag = bool(
-                _orch_choice and _orch_choice != "— Select one —"
-            ) or is_meaningful(orch_narr.get("summary"))
-            coll_flag = any(
-                is_meaningful(coll_narr.get(k))
-                for k in (
-                    "methods",
-                    "auth",
-                    "handling",
-                    "normalization",
-                    "scale",
-                    "tools",
-                )
-            )
-            exec_flag = is_meaningful(exec_narr.get("methods"))
-
-            # Dependencies: treat default pair as no content
-            deps_flag = False
-            if deps:
-                deps_slim = [
-                    {
-                        "name": (d or {}).get("name"),
-                        "details": (d or {}).get("details", "").strip(),
-                    }
-                    for d in deps
-                    if (d or {}).get("name")
-                ]
-                default_deps = [
-                    {"name": "Network Infrastructure", "details": ""},
-                    {"name": "Revision Control system", "details": "GitHub"},
-                ]
-
-                def _sorted(items):
-                    return sorted(
-                        items,
-                        key=lambda x: (x.get("name") or "", x.get("details") or ""),
-                    )
-
-                deps_flag = _sorted(deps_slim) != _sorted(default_deps)
-
-            # Timeline: do NOT trigger content based on default items/dates
-            # Only consider as content if staffing plan markdown has text
-            tl_flag = bool((tl.get("staffing_plan_md") or "").strip())
-
-            # Initiative: ignore known defaults
-            default_title = "My new network automation project"
-            default_desc = (
-                "Here is a short description of my my new network automation project"
-            )
-            title = (ini.get("title") or "").strip()
-            desc = (ini.get("description") or "").strip()
-            ini_flag = bool(
-                (title and title != default_title) or (desc and desc != default_desc)
-            )
-            # My Role: any non-empty answer
-            role_flag = any(
-                ((my_role.get(k) or "").strip()) for k in ("who", "skills", "developer")
-            )
-
-            return any(
-                [
-                    pres_flag,
-                    intent_flag,
-                    obs_flag,
-                    orch_flag,
-                    coll_flag,
-                    exec_flag,
-                    deps_flag,
-                    tl_flag,
-                    ini_flag,
-                    role_flag,
-                ]
-            )
-        except Exception:
-            pass
-        return False
-
+    # Determine if there is meaningful content across sections (the user has made updates)
     any_content = _has_any_content(payload)
     # Fallback: if the user has selected an orchestration choice (including 'No') via session_state,
     # treat that as meaningful content to enable export even before other narratives populate.
     try:
         _orch_choice_ss = (st.session_state.get("orch_choice") or "").strip()
-        if _orch_choice_ss and _orch_choice_ss != "— Select one —":
+        if _orch_choice_ss and _orch_choice_ss != _SELECT_SENTINEL:
             any_content = True
     except Exception:
         pass
 
-    # Dependencies: do not render immediately on the main page; include only in the generated summary
-    deps = payload.get("dependencies", [])
-    if deps:
-        deps_slim = [
-            {
-                "name": (d or {}).get("name"),
-                "details": (d or {}).get("details", "").strip(),
-            }
-            for d in deps
-            if (d or {}).get("name")
-        ]
-        default_deps = [
-            {"name": "Network Infrastructure", "details": ""},
-            {"name": "Revision Control system", "details": "GitHub"},
-        ]
-
-        def _sorted(items):
-            return sorted(
-                items, key=lambda x: (x.get("name") or "", x.get("details") or "")
-            )
-
-        looks_default_deps = _sorted(deps_slim) == _sorted(default_deps)
-        if not looks_default_deps:
-            any_content = True
-
-    if not any_content:
-        # Use same gate as sidebar to decide whether to show the reminder
-        sel = {
-            "pres": (payload.get("presentation", {}) or {}).get("selections", {}),
-            "intent": (payload.get("intent", {}) or {}).get("selections", {}),
-            "obs": (payload.get("observability", {}) or {}).get("selections", {}),
-            "orch": (payload.get("orchestration", {}) or {}).get("selections", {}),
-            "coll": (payload.get("collector", {}) or {}).get("selections", {}),
-            "exec": (payload.get("executor", {}) or {}).get("selections", {}),
-        }
+    # Export gate signals, shared by the reminder, the download and the minimal ZIP
+    has_any_selection, role_nonempty, ini_nondefault, orch_nondefault = _export_gate(
+        payload, st.session_state.get("orch_choice")
+    )
+    show_download = (
+        has_any_selection or ini_nondefault or orch_nondefault or role_nonempty
+    )
+    # Initiative text, stripped once for the summary and the export file names
+    ini = _get_map(payload, "initiative")
+    ini_title = (ini.get("title") or "").strip()
+    ini_desc = (ini.get("description") or "").strip()
 
-        def _has_list_selections(d: dict) -> bool:
-            if not isinstance(d, dict):
-                return False
-            for val in d.values():
-                if isinstance(val, list) and len(val) > 0:
-                    return True
-            return False
-
-        has_any_selection = any(_has_list_selections(v) for v in sel.values())
-        role_nonempty = any(
-            ((payload.get("my_role", {}) or {}).get(k) or "").strip()
-            for k in ("who", "skills", "developer")
-        )
-        ini = payload.get("initiative", {}) or {}
-        default_title = "My new network automation project"
-        default_desc = (
-            "Here is a short description of my my new network automation project"
-        )
-        _title = (ini.get("title") or "").strip()
-        _desc = (ini.get("description") or "").strip()
-        ini_nondefault = bool(
-            (_title and _title != default_title) or (_desc and _desc != default_desc)
-        )
-        orch_sel = (payload.get("orchestration", {}) or {}).get("selections", {}) or {}
-        orch_choice = (orch_sel.get("choice") or "").strip() or (
-            st.session_state.get("orch_choice") or ""
-        ).strip()
-        orch_details = (orch_sel.get("details") or "").strip()
-        # Treat any non-sentinel choice (including 'No') as a meaningful change for gating
-        orch_nondefault = bool(orch_choice and orch_choice != "— Select one —")
-        if not (
-            has_any_selection or ini_nondefault or orch_nondefault or role_nonempty
-        ):
-            st.info(
-                "Start filling in the sections above to see Solution Highlights here. Once you provide inputs, you will also be able to download the Wizard JSON."
-            )
+    if not any_content and not show_download:
+        st.info(
+            "Start filling in the sections above to see Solution Highlights here. Once you provide inputs, you will also be able to download the Wizard JSON."
+        )
 
     # Markdown summary builder & export — only when there is meaningful content
     if any_content:
         # Build a concise markdown summary from current payload
-        def _section_md(title, lines):
-            lines = [l for l in (lines or []) if (l or "").strip()]
+        summary_parts = []
+
+        def _add_section(title, lines):
+            # Sections without any non-blank line are left out entirely
             if not lines:
-                return ""
-            return f"## {title}\n" + "\n".join(lines) + "\n\n"
+                return
+            body = "\n".join(l for l in lines if l and l.strip())
+            if body:
+                summary_parts.append(f"## {title}\n{body}\n\n")
 
-        summary_parts = []
         # My Role (show if any field present)
-        my_role = payload.get("my_role", {}) or {}
+        my_role = _get_map(payload, "my_role")
         role_lines = []
         if (my_role.get("who") or "").strip():
             role_lines.append(f"- Who: {my_role.get('who')}")
@@ -2585,26 +2845,19 @@ def solution_wizard_main():
             role_lines.append(f"- Skills: {my_role.get('skills')}")
         if (my_role.get("developer") or "").strip():
             role_lines.append(f"- Developer: {my_role.get('developer')}")
-        summary_parts.append(_section_md("My Role", role_lines))
+        _add_section("My Role", role_lines)
         # Initiative (suppress known defaults)
-        ini = payload.get("initiative", {})
         ini_lines = []
-        default_title = "My new network automation project"
-        default_desc = (
-            "Here is a short description of my my new network automation project"
-        )
-        _title = (ini.get("title") or "").strip()
-        _desc = (ini.get("description") or "").strip()
         _out = (ini.get("out_of_scope") or "").strip()
-        if _title and _title != default_title:
-            ini_lines.append(f"- Title: {_title}")
-        if _desc and _desc != default_desc:
-            ini_lines.append(f"- Scope: {_desc}")
+        if ini_title and ini_title != _DEFAULT_TITLE:
+            ini_lines.append(f"- Title: {ini_title}")
+        if ini_desc and ini_desc != _DEFAULT_DESC:
+            ini_lines.append(f"- Scope: {ini_desc}")
         if _out:
             ini_lines.append(f"- Out of scope: {_out}")
         # If details_md exists, we keep it for the export doc, but don't render here to avoid duplication
-        summary_parts.append(_section_md("Initiative", ini_lines))
-        
+        _add_section("Initiative", ini_lines)
+
         # Use Cases Summary (titles only)
         use_cases = payload.get("use_cases", []) or []
         uc_lines = []
@@ -2614,96 +2867,71 @@ def solution_wizard_main():
                 uc_lines.append(f"- Use Case {i + 1}: {uc_name}")
         else:
             uc_lines.append("- No use cases defined")
-        summary_parts.append(_section_md("Automation Use Cases", uc_lines))
-        
+        _add_section("Automation Use Cases", uc_lines)
+
         # Presentation
-        pres = payload.get("presentation", {})
+        pres = _get_map(payload, "presentation")
         pres_lines = []
         for k in ("users", "interaction", "tools", "auth"):
             v = pres.get(k)
             if v and is_meaningful(v):
                 pres_lines.append(f"- {v}")
-        summary_parts.append(_section_md("Presentation", pres_lines))
+        _add_section("Presentation", pres_lines)
 
         # Intent
-        intent = payload.get("intent", {})
+        intent = _get_map(payload, "intent")
         intent_lines = []
         for k in ("development", "provided"):
             v = intent.get(k)
             if v and is_meaningful(v):
                 intent_lines.append(f"- {v}")
-        summary_parts.append(_section_md("Intent", intent_lines))
+        _add_section("Intent", intent_lines)
 
         # Observability
-        obs = payload.get("observability", {})
+        obs = _get_map(payload, "observability")
         obs_lines = []
         for k in ("methods", "go_no_go", "additional_logic", "tools"):
             v = obs.get(k)
             if v and is_meaningful(v):
                 obs_lines.append(f"- {v}")
-        summary_parts.append(_section_md("Observability", obs_lines))
+        _add_section("Observability", obs_lines)
 
         # Orchestration
-        orch = payload.get("orchestration", {})
+        orch = _get_map(payload, "orchestration")
         orch_lines = []
         v = orch.get("summary")
         if v and is_meaningful(v):
             orch_lines.append(f"- {v}")
-        summary_parts.append(_section_md("Orchestration", orch_lines))
+        _add_section("Orchestration", orch_lines)
 
         # Collector
-        collector = payload.get("collector", {})
+        collector = _get_map(payload, "collector")
         col_lines = []
         for k in ("methods", "auth", "handling", "normalization", "scale", "tools"):
             v = collector.get(k)
             if v and is_meaningful(v):
                 col_lines.append(f"- {v}")
-        summary_parts.append(_section_md("Collector", col_lines))
+        _add_section("Collector", col_lines)
 
         # Executor
-        executor = payload.get("executor", {})
+        executor = _get_map(payload, "executor")
         exe_lines = []
         v = executor.get("methods")
         if v and is_meaningful(v):
             exe_lines.append(f"- {v}")
-        summary_parts.append(_section_md("Executor", exe_lines))
+        _add_section("Executor", exe_lines)
 
-        # Dependencies (suppress default pair)
-        deps = payload.get("dependencies", [])
+        # Dependencies (suppress default pair); shown only in the generated
+        # summary, never on the main page
+        dep_pairs = _dep_pairs(payload.get("dependencies"))
         dep_lines = []
-        if deps:
-            deps_slim = [
-                {
-                    "name": (d or {}).get("name"),
-                    "details": (d or {}).get("details", "").strip(),
-                }
-                for d in deps
-                if (d or {}).get("name")
-            ]
-            default_deps = [
-                {"name": "Network Infrastructure", "details": ""},
-                {"name": "Revision Control system", "details": "GitHub"},
-            ]
-
-            def _sorted(items):
-                return sorted(
-                    items, key=lambda x: (x.get("name") or "", x.get("details") or "")
-                )
-
-            if _sorted(deps_slim) != _sorted(default_deps):
-                for d in deps_slim:
-                    name = d.get("name")
-                    details = d.get("details")
-                    if name:
-                        dep_lines.append(
-                            f"- {name}{(': ' + details) if details else ''}"
-                        )
-        summary_parts.append(
-            _section_md("Dependencies & External Interfaces", dep_lines)
-        )
+        if frozenset(dep_pairs) != _DEFAULT_DEPS_FSET:
+            for name, details in dep_pairs:
+                dep_lines.append(f"- {name}{(': ' + details) if details else ''}")
+        _add_section("Dependencies & External Interfaces", dep_lines)
 
         # Timeline (only when there are milestone items or staffing plan text)
-        tl = payload.get("timeline", {})
+        tl = _get_map(payload, "timeline")
         tl_lines = []
         items = tl.get("items") or []
         tl_staff_md = (tl.get("staffing_plan_md") or "").strip()
@@ -2719,9 +2947,7 @@ def solution_wizard_main():
                 tl_lines.append(
                     f"  - {i.get('name')}: {i.get('start')} → {i.get('end')} ({i.get('duration_bd')} bd)"
                 )
-            summary_parts.append(
-                _section_md("Staffing, Timeline, & Milestones", tl_lines)
-            )
+            _add_section("Staffing, Timeline, & Milestones", tl_lines)
         if tl_staff_md:
             summary_parts.append("\n## Staffing Plan\n")
             summary_parts.append(tl_staff_md + "\n")
@@ -2739,7 +2965,7 @@ def solution_wizard_main():
                 )
                 st.markdown(summary_md)
 
-    if any_content:
+    if any_content and show_download:
         # Build a comprehensive payload including defaults for any missing sections
         final_payload = dict(payload)
         final_payload = dict(payload) if isinstance(payload, dict) else {}
@@ -2750,100 +2976,17 @@ def solution_wizard_main():
             final_payload["initiative"] = {}
 
         # Defaults for sections
-        if "my_role" not in final_payload:
-            final_payload["my_role"] = {"who": "", "skills": "", "developer": ""}
-        if "presentation" not in final_payload:
-            final_payload["presentation"] = {
-                "users": "",
-                "interaction": "",
-                "tools": "",
-                "auth": "",
-                "selections": {
-                    "users": [],
-                    "interactions": [],
-                    "tools": [],
-                    "auth": [],
-                },
-            }
-
-        if "intent" not in final_payload:
-            final_payload["intent"] = {
-                "development": "",
-                "provided": "",
-                "selections": {
-                    "development": [],
-                    "provided": [],
-                },
-            }
-
-        if "observability" not in final_payload:
-            final_payload["observability"] = {
-                "methods": "",
-                "go_no_go": "",
-                "additional_logic": "",
-                "tools": "",
-                "selections": {
-                    "methods": [],
-                    "go_no_go_text": "",
-                    "additional_logic_enabled": False,
-                    "additional_logic_text": "",
-                    "tools": [],
-                },
-            }
-
-        if "orchestration" not in final_payload:
-            final_payload["orchestration"] = {
-                "summary": "",
-                "selections": {
-                    "choice": "No",
-                    "details": "",
-                },
-            }
-
-        if "executor" not in final_payload:
-            final_payload["executor"] = {
-                "methods": "",
-                "selections": {"methods": []},
-            }
-
-        if "collector" not in final_payload:
-            final_payload["collector"] = {
-                "methods": "",
-                "auth": "",
-                "handling": "",
-                "normalization": "",
-                "scale": "",
-                "tools": "",
-                "selections": {
-                    "methods": [],
-                    "auth": [],
-                    "handling": [],
-                    "normalization": [],
-                    "devices": "",
-                    "metrics_per_sec": "",
-                    "cadence": "",
-                    "tools": [],
-                },
-            }
+        for _key, _tmpl in _DEFAULT_SECTIONS.items():
+            if _key not in final_payload:
+                final_payload[_key] = copy.deepcopy(_tmpl)
 
         if "dependencies" not in final_payload:
             final_payload["dependencies"] = [
-                {"name": "Network Infrastructure", "details": ""},
-                {"name": "Revision Control system", "details": "GitHub"},
+                {"name": name, "details": details} for name, details in _DEFAULT_DEPS
             ]
 
         if "timeline" not in final_payload:
             # Construct a default timeline with computed dates (weekdays only, no holidays)
-
-            def _add_bd(d: date, n: int):
-                cur = d
-                days = int(n or 0)
-                while days > 0:
-                    cur = cur + timedelta(days=1)
-                    if cur.weekday() < 5:
-                        days -= 1
-                return cur
-
             start = datetime.datetime.today().date()
             default_items = [
                 {"name": "Planning", "duration_bd": 5, "notes": ""},
@@ -2859,7 +3002,7 @@ def solution_wizard_main():
             for it in default_items:
                 dur = int(it["duration_bd"])
                 s = cursor
-                e = _add_bd(s, dur) if dur > 0 else s
+                e = _add_business_days(s, dur) if dur > 0 else s
                 schedule.append(
                     {
                         "name": it["name"],
@@ -2897,26 +3040,10 @@ def solution_wizard_main():
             final_payload["naf_report_md"] = summary_md if summary_md else ""
 
         # Build bundled ZIP with JSON, SDD Markdown, and color Gantt chart
-        def _sanitize_title(t: str) -> str:
-            t = (t or "").strip()
-            # Replace any non-alphanumeric with underscore
-            out = []
-            for ch in t:
-                if ch.isalnum() or ch in {"-", "_"}:
-                    out.append(ch)
-                else:
-                    out.append("_")
-            t = "".join(out)
-            # Collapse consecutive underscores and strip
-            while "__" in t:
-                t = t.replace("__", "_")
-            t = t.strip("_")
-            return (t or "solution")[0:30]
-
-        title_for_zip = _sanitize_title(
-            (payload.get("initiative", {}) or {}).get("title", "")
-        )
-        ts = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        title_for_zip = _sanitize_title(ini_title)
+        # One UTC instant for the file names and the SDD "Generated" stamp
+        export_now = datetime.datetime.now(datetime.timezone.utc)
+        ts = _fmt_ts(export_now)
         zip_name = f"naf_report_{title_for_zip}_{ts}.zip"
 
         # Ensure initiative exists
@@ -2924,34 +3051,14 @@ def solution_wizard_main():
             final_payload["initiative"] = payload.get("initiative", {})
 
         # JSON content
-        final_json_bytes = json.dumps(final_payload, indent=2).encode("utf-8")
+        final_json_bytes = _json_bytes(final_payload)
 
         # SDD Markdown rendered via Jinja2 template
-        sdd_ts = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-        templates_dir = (Path(__file__).resolve().parent / "templates").as_posix()
+        sdd_ts = export_now.strftime("%Y-%m-%dT%H:%M:%SZ")
         try:
-            env = Environment(loader=FileSystemLoader(templates_dir))
-            tmpl = env.get_template("Solution_Design_Report.j2")
+            tmpl = _JINJA_ENV.get_template("Solution_Design_Report.j2")
             # Remove sections that are rendered separately in the template to prevent duplication
-            _hl = (summary_md or "").strip()
-            try:
-                for heading in (
-                    "Initiative",
-                    "Presentation",
-                    "Intent",
-                    "Observability",
-                    "Orchestration",
-                    "Collector",
-                    "Executor",
-                    "Dependencies",
-                    "Staffing, Timeline, & Milestones",
-                    "Staffing Plan",
-                ):
-                    pattern = rf"(?ms)^##\s*{re.escape(heading)}\b.*?(?=^##\s|\Z)"
-                    _hl = re.sub(pattern, "", _hl)
-                _hl = _hl.strip()
-            except Exception:
-                pass
+            _hl = _HL_STRIP_RE.sub("", (summary_md or "").strip()).strip()
             context = {
                 "generated_timestamp": sdd_ts,
                 "highlights": _hl,
@@ -2984,42 +3091,19 @@ def solution_wizard_main():
             sdd_doc_md = "\n\n".join(basic_doc).encode("utf-8")
         else:
             # Defer rendering until after we know if a PNG was produced to set gantt_image_path
-            sdd_template_env = (env, tmpl, context)
+            sdd_template_env = (tmpl, context)
 
         # Rebuild a color Gantt chart from payload timeline
         gantt_png_bytes = None
         gantt_html_bytes = None
         try:
-            tl = final_payload.get("timeline", {})
-            rows = []
-            for it in (tl.get("items") or [])[:100]:
-                rows.append(
-                    {
-                        "Task": it.get("name", "Task"),
-                        "Start": it.get("start"),
-                        "Finish": it.get("end"),
-                    }
-                )
+            tl = _get_map(final_payload, "timeline")
+            rows = tuple(
+                (it.get("name", "Task"), it.get("start"), it.get("end"))
+                for it in (tl.get("items") or [])[:100]
+            )
             if rows:
-                df = pd.DataFrame(rows)
-                fig = px.timeline(
-                    df,
-                    x_start="Start",
-                    x_end="Finish",
-                    y="Task",
-                    color="Task",
-                    color_discrete_sequence=px.colors.qualitative.Set3,
-                )
-                fig.update_yaxes(autorange="reversed")
-                # Try PNG first (requires kaleido)
-                try:
-                    gantt_png_bytes = fig.to_image(format="png", scale=2)
-                except Exception:
-                    gantt_png_bytes = None
-                # Always prepare HTML fallback
-                gantt_html_bytes = fig.to_html(
-                    full_html=True, include_plotlyjs="cdn"
-                ).encode("utf-8")
+                gantt_png_bytes, gantt_html_bytes = _gantt_export_bytes(rows)
         except Exception:
             pass
 
@@ -3034,14 +3118,20 @@ def solution_wizard_main():
             )
 
         # Create ZIP in-memory
+        import zipfile
+
         zip_buf = io.BytesIO()
-        with zipfile.ZipFile(zip_buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        # Fast DEFLATE for the small text artifacts; PNGs are already compressed
+        # and are stored as-is
+        with zipfile.ZipFile(
+            zip_buf, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
             json_name = f"naf_report_{title_for_zip}_{ts}.json"
             md_name = f"naf_report_{title_for_zip}_{ts}.md"
             zf.writestr(json_name, final_json_bytes)
             # Write markdown after potential Gantt generation so template can reference image name
             try:
-                env, tmpl, context = sdd_template_env  # type: ignore
+                tmpl, context = sdd_template_env  # type: ignore
                 # Update gantt_image_path based on actual artifact (store under images/)
                 context["gantt_image_path"] = (
                     "images/Gantt.png" if gantt_png_bytes else None
@@ -3064,176 +3154,97 @@ def solution_wizard_main():
                     ).encode("utf-8")
             zf.writestr(md_name, sdd_doc_md)
             if gantt_png_bytes:
-                zf.writestr("images/Gantt.png", gantt_png_bytes)
+                zf.writestr(
+                    "images/Gantt.png",
+                    gantt_png_bytes,
+                    compress_type=zipfile.ZIP_STORED,
+                )
             elif gantt_html_bytes:
                 # Provide an HTML fallback if PNG isn't available (no kaleido)
                 zf.writestr("Gantt.html", gantt_html_bytes)
 
             # Include branding icon if available so Markdown image resolves
-            try:
-                icon_path = (
-                    Path(__file__).parent / "images" / "naf_icon.png"
-                ).resolve()
-                if icon_path.exists():
-                    with open(icon_path, "rb") as f:
-                        zf.writestr("images/naf_icon.png", f.read())
-            except Exception:
-                pass
+            icon_bytes = _image_bytes(_NAF_ICON_PATH)
+            if isinstance(icon_bytes, bytes):
+                zf.writestr(
+                    "images/naf_icon.png",
+                    icon_bytes,
+                    compress_type=zipfile.ZIP_STORED,
+                )
 
         zip_bytes = zip_buf.getvalue()
-        # Export (single ZIP download) only when summary has meaningful content
-        # and at least one selection array is non-empty (to avoid pure-default narratives)
-        sel = {
-            "pres": (payload.get("presentation", {}) or {}).get("selections", {}),
-            "intent": (payload.get("intent", {}) or {}).get("selections", {}),
-            "obs": (payload.get("observability", {}) or {}).get("selections", {}),
-            "orch": (payload.get("orchestration", {}) or {}).get("selections", {}),
-            "coll": (payload.get("collector", {}) or {}).get("selections", {}),
-            "exec": (payload.get("executor", {}) or {}).get("selections", {}),
-        }
-        role_nonempty = any(
-            ((payload.get("my_role", {}) or {}).get(k) or "").strip()
-            for k in ("who", "skills", "developer")
-        )
-
-        def _has_list_selections(d: dict) -> bool:
-            if not isinstance(d, dict):
-                return False
-            for val in d.values():
-                if isinstance(val, list) and len(val) > 0:
-                    return True
-            return False
-
-        has_any_selection = (
-            any(_has_list_selections(v) for v in sel.values()) or role_nonempty
-        )
-        ini = payload.get("initiative", {}) or {}
-        default_title = "My new network automation project"
-        default_desc = (
-            "Here is a short description of my my new network automation project"
-        )
-        _title = (ini.get("title") or "").strip()
-        _desc = (ini.get("description") or "").strip()
-        ini_nondefault = bool(
-            (_title and _title != default_title) or (_desc and _desc != default_desc)
-        )
-        orch_sel = (payload.get("orchestration", {}) or {}).get("selections", {}) or {}
-        orch_choice = (orch_sel.get("choice") or "").strip() or (
-            st.session_state.get("orch_choice") or ""
-        ).strip()
-        orch_details = (orch_sel.get("details") or "").strip()
-        # Treat any non-sentinel choice (including 'No') as a meaningful change for gating
-        orch_nondefault = bool(orch_choice and orch_choice != "— Select one —")
-        if has_any_selection or ini_nondefault or orch_nondefault or role_nonempty:
-            with st.expander("Save Solution Artifacts", expanded=True):
-                st.caption("Download your current scenario (JSON + Markdown + Gantt)")
-                st.download_button(
-                    label="📦 Download (JSON + Markdown + Gantt)",
-                    data=zip_bytes,
-                    file_name=zip_name,
-                    mime="application/zip",
-                    use_container_width=True,
-                    key="wizard_zip_download_btn",
-                )
-        else:
-            with st.expander("Save Solution Artifacts", expanded=False):
-                st.info(
-                    "Start filling in the sections above to see Solution Highlights here. Once you provide inputs, you will also be able to download the Wizard JSON."
-                )
-    else:
+        # Export (single ZIP download); the artifacts above are only built when
+        # the download is actually offered
+        with st.expander("Save Solution Artifacts", expanded=True):
+            st.caption("Download your current scenario (JSON + Markdown + Gantt)")
+            st.download_button(
+                label="📦 Download (JSON + Markdown + Gantt)",
+                data=zip_bytes,
+                file_name=zip_name,
+                mime="application/zip",
+                use_container_width=True,
+                key="wizard_zip_download_btn",
+            )
+    elif (
+        not any_content
+        and orch_nondefault
+        and not (has_any_selection or ini_nondefault or role_nonempty)
+    ):
         # Build a minimal ZIP when a non-sentinel Orchestration choice exists, even if summary is empty
-        sel = {
-            "pres": (payload.get("presentation", {}) or {}).get("selections", {}),
-            "intent": (payload.get("intent", {}) or {}).get("selections", {}),
-            "obs": (payload.get("observability", {}) or {}).get("selections", {}),
-            "orch": (payload.get("orchestration", {}) or {}).get("selections", {}),
-            "coll": (payload.get("collector", {}) or {}).get("selections", {}),
-            "exec": (payload.get("executor", {}) or {}).get("selections", {}),
-        }
-
-        def _has_list_selections(d: dict) -> bool:
-            if not isinstance(d, dict):
-                return False
-            for val in d.values():
-                if isinstance(val, list) and len(val) > 0:
-                    return True
-            return False
-
-        has_any_selection = any(_has_list_selections(v) for v in sel.values())
-        role_nonempty = any(
-            ((payload.get("my_role", {}) or {}).get(k) or "").strip()
-            for k in ("who", "skills", "developer")
-        )
-        ini = payload.get("initiative", {}) or {}
-        default_title = "My new network automation project"
-        default_desc = (
-            "Here is a short description of my my new network automation project"
-        )
-        _title = (ini.get("title") or "").strip()
-        _desc = (ini.get("description") or "").strip()
-        ini_nondefault = bool(
-            (_title and _title != default_title) or (_desc and _desc != default_desc)
-        )
-        orch_sel = (payload.get("orchestration", {}) or {}).get("selections", {}) or {}
-        orch_choice = (orch_sel.get("choice") or "").strip() or (
-            st.session_state.get("orch_choice") or ""
-        ).strip()
-        orch_nondefault = bool(orch_choice and orch_choice != "— Select one —")
-        if orch_nondefault and not (
-            has_any_selection or ini_nondefault or role_nonempty
+        # (minimal payload & ZIP: JSON + minimal MD)
+        final_payload = dict(payload) if isinstance(payload, dict) else {}
+        if "initiative" not in final_payload or not isinstance(
+            final_payload.get("initiative"), dict
         ):
-            # Minimal payload & ZIP (JSON + minimal MD)
-            final_payload = dict(payload) if isinstance(payload, dict) else {}
-            if "initiative" not in final_payload or not isinstance(
-                final_payload.get("initiative"), dict
-            ):
-                final_payload["initiative"] = {}
-            final_payload_bytes = json.dumps(final_payload, indent=2).encode("utf-8")
-            ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            title_for_zip = (
-                re.sub(r"[^A-Za-z0-9_-]+", "_", (_title or "solution")).strip("_")
-                or "solution"
+            final_payload["initiative"] = {}
+        final_payload_bytes = _json_bytes(final_payload)
+        ts = _fmt_ts(datetime.datetime.now())
+        title_for_zip = (
+            _TITLE_SANITIZE_RE.sub("_", (ini_title or "solution")).strip("_")
+            or "solution"
+        )
+        zip_name = f"naf_report_{title_for_zip}_{ts}.zip"
+        import zipfile
+
+        zip_buf = io.BytesIO()
+        # Fast DEFLATE for the small text artifacts; PNGs are already compressed
+        # and are stored as-is
+        with zipfile.ZipFile(
+            zip_buf, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
+            # Enforce naf_report_ prefix for artifacts
+            zf.writestr(f"naf_report_{title_for_zip}_{ts}.json", final_payload_bytes)
+            # The Markdown stub is a few bytes; deflating it would only add overhead
+            zf.writestr(
+                f"naf_report_{title_for_zip}_{ts}.md",
+                ("# Solution Design Document\n\n").encode("utf-8"),
+                compress_type=zipfile.ZIP_STORED,
             )
-            zip_name = f"naf_report_{title_for_zip}_{ts}.zip"
-            zip_buf = io.BytesIO()
-            with zipfile.ZipFile(
-                zip_buf, mode="w", compression=zipfile.ZIP_DEFLATED
-            ) as zf:
-                # Enforce naf_report_ prefix for artifacts
+            # Include branding icon if available in minimal ZIP as well
+            icon_bytes = _image_bytes(_NAF_ICON_PATH)
+            if isinstance(icon_bytes, bytes):
                 zf.writestr(
-                    f"naf_report_{title_for_zip}_{ts}.json", final_payload_bytes
-                )
-                zf.writestr(
-                    f"naf_report_{title_for_zip}_{ts}.md",
-                    ("# Solution Design Document\n\n").encode("utf-8"),
-                )
-                # Include branding icon if available in minimal ZIP as well
-                try:
-                    icon_path = (
-                        Path(__file__).parent / "images" / "naf_icon.png"
-                    ).resolve()
-                    if icon_path.exists():
-                        with open(icon_path, "rb") as f:
-                            zf.writestr("images/naf_icon.png", f.read())
-                except Exception:
-                    pass
-            zip_bytes = zip_buf.getvalue()
-            with st.expander("Save Solution Artifacts", expanded=True):
-                st.caption("Download your current scenario (JSON + Markdown + Gantt)")
-                st.download_button(
-                    label="📦 Download (JSON + Markdown + Gantt)",
-                    data=zip_bytes,
-                    file_name=zip_name,
-                    mime="application/zip",
-                    use_container_width=True,
-                    key="wizard_zip_download_btn",
-                )
-        else:
-            # Reminder when no content yet
-            with st.expander("Save Solution Artifacts", expanded=False):
-                st.info(
-                    "Start filling in the sections above to see Solution Highlights here. Once you provide inputs, you will also be able to download the Wizard JSON."
+                    "images/naf_icon.png",
+                    icon_bytes,
+                    compress_type=zipfile.ZIP_STORED,
                 )
+        zip_bytes = zip_buf.getvalue()
+        with st.expander("Save Solution Artifacts", expanded=True):
+            st.caption("Download your current scenario (JSON + Markdown + Gantt)")
+            st.download_button(
+                label="📦 Download (JSON + Markdown + Gantt)",
+                data=zip_bytes,
+                file_name=zip_name,
+                mime="application/zip",
+                use_container_width=True,
+                key="wizard_zip_download_btn",
+            )
+    else:
+        # Reminder when no content yet (or nothing worth exporting)
+        with st.expander("Save Solution Artifacts", expanded=False):
+            st.info(
+                "Start filling in the sections above to see Solution Highlights here. Once you provide inputs, you will also be able to download the Wizard JSON."
+            )
 
     # Diagram removed per request; SDD export available above.
 
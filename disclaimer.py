@@ -4,26 +4,37 @@ Disclaimer Page
 
 This page presents the application's disclaimer.
 """
-import streamlit as st
+from typing import Final
+
+
+# Static disclaimer body, pre-rendered to HTML once at import so reruns skip
+# Markdown parsing on both the backend and the frontend.
+_DISCLAIMER_HTML: Final[str] = (
+    "<p>"
+    "The calculations, outputs, and recommendations presented by this application are for informational purposes only. "
+    "Results are entirely dependent on the inputs provided by the user and any assumptions entered. "
+    "It is the user's responsibility to validate all inputs, review the outputs for accuracy and suitability, and apply appropriate professional judgment before making decisions based on these results."
+    "</p>"
+    "<p>By using this application, you acknowledge and agree that:</p>"
+    '<ul style="margin-bottom:1.5rem;">'
+    "<li>You are solely responsible for the data you enter and for any conclusions or decisions you draw from the results.</li>"
+    "<li>The authors and contributors make no warranties, express or implied, regarding accuracy, completeness, or fitness for a particular purpose.</li>"
+    "<li>The authors and contributors shall not be liable for any losses or damages arising from use of or reliance on the results.</li>"
+    "</ul>"
+)
+
+_HOME_TARGET: Final[str] = "Automation_BusinessCase_App.py"
+_HOME_LABEL: Final[str] = "Return to Home"
+_HOME_ICON: Final[str] = "🏠"
 
 
 def main():
+    import streamlit as st
+
     st.set_page_config(page_title="Disclaimer", page_icon="⚠️", layout="wide")
     st.title("Disclaimer")
-    st.markdown(
-        """
-        The calculations, outputs, and recommendations presented by this application are for informational purposes only. 
-        Results are entirely dependent on the inputs provided by the user and any assumptions entered. 
-        It is the user's responsibility to validate all inputs, review the outputs for accuracy and suitability, and apply appropriate professional judgment before making decisions based on these results.
-        
-        By using this application, you acknowledge and agree that:
-        - You are solely responsible for the data you enter and for any conclusions or decisions you draw from the results.
-        - The authors and contributors make no warranties, express or implied, regarding accuracy, completeness, or fitness for a particular purpose.
-        - The authors and contributors shall not be liable for any losses or damages arising from use of or reliance on the results.
-        """
-    )
-    st.markdown("\n")
-    st.page_link("Automation_BusinessCase_App.py", label="Return to Home", icon="🏠")
+    st.html(_DISCLAIMER_HTML)
+    st.page_link(_HOME_TARGET, label=_HOME_LABEL, icon=_HOME_ICON)
 
 
 if __name__ == "__main__":
@@ -12,14 +12,30 @@ __copyright__ = "Copyright (c) 2025 Claudia"
 __license__ = "Python"
 
 
+import functools
 import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import streamlit as st
-import yaml
 from NAF_NAF_Solution_Wizard import render_global_sidebar
 
+# Fields of a blank use case record (all text, so a shallow copy is enough)
+_BLANK_UC_TEMPLATE: Dict[str, str] = {
+    "name": "",
+    "description": "",
+    "expected_outcome": "",
+    "category": "",
+    "assumptions": "",
+    "trigger": "",
+    "building_blocks": "",
+    "setup_task": "",
+    "tasks": "",
+    "standard_deployment_strategy": "",
+    "deployment_strategy": "",
+    "error_conditions": "",
+}
+
 # Page config for consistent favicon across all pages
 st.set_page_config(
     page_title="Automation Use Cases",
@@ -28,6 +44,37 @@ st.set_page_config(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_yaml_option_keys(filename: str) -> Tuple[str, ...]:
+    """Return the top-level keys of a bundled YAML lookup file.
+
+    Parsed once per process: the files ship with the app and do not change
+    between reruns. PyYAML is imported here, on first use, rather than at
+    page load. Read/parse errors propagate so they are never cached.
+    """
+
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it, else pure Python
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(Path(__file__).parent.parent / filename, "r") as f:
+        data = yaml.load(f, Loader=loader)
+    return tuple(data.keys()) if data else ()
+
+
+def _yaml_option_keys(filename: str) -> Tuple[str, ...]:
+    """Return the top-level keys of a bundled YAML lookup file (empty on error).
+
+    A failed read is retried on the next rerun instead of leaving the
+    selectbox empty until the process restarts.
+    """
+
+    try:
+        return _load_yaml_option_keys(filename)
+    except Exception:
+        return ()
+
+
 def _ensure_state() -> None:
     """Ensure the use_cases list and active index exist in session_state."""
 
@@ -43,27 +90,21 @@ def _ensure_state() -> None:
 def _new_use_case() -> Dict[str, Any]:
     """Return a new blank use case record."""
 
-    return {
-        "name": "",
-        "description": "",
-        "expected_outcome": "",
-        "category": "",
-        "assumptions": "",
-        "trigger": "",
-        "building_blocks": "",
-        "setup_task": "",
-        "tasks": "",
-        "standard_deployment_strategy": "",
-        "deployment_strategy": "",
-        "error_conditions": "",
-    }
+    return dict(_BLANK_UC_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _label_text(idx: int, name: str, description: str) -> str:
+    """Build (and memoize) the selector label for one use case position."""
+
+    base = (name or description or "Use Case").strip() or "Use Case"
+    return f"{idx + 1}. {base[:60]}"  # pragma: no cover - UI detail
 
 
 def _label_for(idx: int, uc: Dict[str, Any]) -> str:
     """Generate a short label for a use case selector."""
 
-    base = (uc.get("name") or uc.get("description") or "Use Case").strip() or "Use Case"
-    return f"{idx + 1}. {base[:60]}"  # pragma: no cover - UI detail
+    return _label_text(idx, uc.get("name") or "", uc.get("description") or "")
 
 
 def _select_use_case() -> int:
@@ -96,6 +137,8 @@ def _edit_use_case(idx: int) -> None:
     if idx < 0 or idx >= len(use_cases):
         return
 
+    # uc is the dict held in st.session_state["use_cases"]; the field
+    # assignments below update it in place, so no write-back is needed
     uc = use_cases[idx]
 
     st.subheader("Use Case Details")
@@ -127,13 +170,7 @@ def _edit_use_case(idx: int) -> None:
     )
 
     # Category (load from YAML file)
-    yaml_path = Path(__file__).parent.parent / "use_case_categories.yml"
-    try:
-        with open(yaml_path, "r") as f:
-            categories_data = yaml.safe_load(f)
-        category_options = list(categories_data.keys()) if categories_data else []
-    except Exception:
-        category_options = []
+    category_options = list(_yaml_option_keys("use_case_categories.yml"))
     # Add placeholder as first option
     placeholder = "— Select a category —"
     category_options_with_placeholder = [placeholder] + category_options
@@ -226,13 +263,7 @@ def _edit_use_case(idx: int) -> None:
     )
 
     # Standard Deployment Strategy (load from YAML file)
-    deploy_yaml_path = Path(__file__).parent.parent / "deployment_strategies.yml"
-    try:
-        with open(deploy_yaml_path, "r") as f:
-            deploy_data = yaml.safe_load(f)
-        deploy_options = list(deploy_data.keys()) if deploy_data else []
-    except Exception:
-        deploy_options = []
+    deploy_options = list(_yaml_option_keys("deployment_strategies.yml"))
     # Add placeholder as first option
     deploy_placeholder = "— Select a deployment strategy —"
     deploy_options_with_placeholder = [deploy_placeholder] + deploy_options
@@ -276,9 +307,6 @@ def _edit_use_case(idx: int) -> None:
         ),
     )
 
-    # Persist edits back to the list
-    st.session_state["use_cases"][idx] = uc
-
 
 def main() -> None:
     """
@@ -13,12 +13,15 @@ def test_join_human_single_and_multi():
     assert join_human(["CLI"]) == "CLI"
     assert join_human(["CLI", "API"]) == "CLI and API"
     assert join_human(["CLI", "GUI", "API"]) == "CLI, GUI and API"
+    assert join_human(["CLI", "API"], prefiltered=True) == "CLI and API"
+    assert join_human([], prefiltered=True) == "TBD"
 
 
 def test_md_line():
     assert md_line("Something") == "- Something"
     assert md_line("") == ""
     assert md_line(None) == ""
+    assert md_line(3) == "- 3"
 
 
 def test_is_meaningful_filters_placeholders_and_tbd():
@@ -29,6 +32,9 @@ def test_is_meaningful_filters_placeholders_and_tbd():
     assert not is_meaningful("This solution will not employ a distinct orchestration layer.")
 
     assert is_meaningful("Users will interact with the solution via CLI and API.")
+    assert not is_meaningful("Scale targets are TBD.")
+    # Only the standalone word counts as a placeholder marker
+    assert is_meaningful("Collect via the netbdx exporter")
 
 
 def test_sentence_examples_like_wizard_usage():
@@ -13,46 +13,64 @@ __license__ = "Python"
 
 # from __future__ import annotations
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Optional
 
+import streamlit as st
 
-def thick_hr(color: str = "red", thickness: int = 3, margin: str = "1rem 0"):
+# Horizontal-rule palette, built once; hr_colors() hands out this view
+_HR_COLORS = MappingProxyType(
+    {
+        "naf_yellow": "#fffe03",
+        "eia_blue": "#92c0e4",
+        "eia_dkblue": "#122e43",
+    }
+)
+
+
+_HR_TPL = (
+    '<hr style="border:none;height:{t}px;background-color:{c};margin:{m};">'
+)
+
+
+@lru_cache(maxsize=32)
+def _hr_html(color: str, thickness: int, margin: str) -> str:
+    """Return the <hr> markup for thick_hr; memoized per style."""
+    return _HR_TPL.format_map({"t": thickness, "c": color, "m": margin})
+
+
+def thick_hr(
+    color: str = "red",
+    thickness: int = 3,
+    margin_y_px: int = 16,
+    margin: Optional[str] = None,
+):
     """
     Render a visually thicker horizontal line in Streamlit using raw HTML.
 
     Parameters
     - color: CSS color for the rule (named color or hex).
     - thickness: Pixel height of the line.
-    - margin: CSS margin to apply (e.g., "1rem 0").
+    - margin_y_px: Vertical margin in pixels above and below the line.
+    - margin: CSS margin shorthand (e.g., "0.75rem 0 0.25rem 0"); overrides
+      margin_y_px when given.
 
     Behavior
     - Uses st.markdown with unsafe_allow_html to inject an <hr> replacement.
     """
-    st.markdown(
-        f"""
-        <hr style="
-            border: none;
-            height: {thickness}px;
-            background-color: {color};
-            margin: {margin};
-        ">
-        """,
-        unsafe_allow_html=True,
-    )
+    if margin is None:
+        margin = f"{margin_y_px}px 0"
+    st.markdown(_hr_html(color, thickness, margin), unsafe_allow_html=True)
 
 
 def hr_colors():
     """
-    Returns a dictionary of colors for horizontal lines.
+    Returns a read-only mapping of colors for horizontal lines.
 
     utils.thick_hr(color="#6785a0", thickness=3)
     """
-    hr_color_dict = {
-        "naf_yellow": "#fffe03",
-        "eia_blue": "#92c0e4",
-        "eia_dkblue": "#122e43",
-    }
-    return hr_color_dict
+    return _HR_COLORS
 
 
 def main():
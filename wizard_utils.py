@@ -1,14 +1,23 @@
-def join_human(items):
+import re
+
+
+def join_human(items, prefiltered: bool = False):
     """
     Join a list of strings with commas and 'and' for the last item.
     Empty/falsey items are ignored. If none remain, returns 'TBD'.
+    Pass prefiltered=True when items is already a list of non-empty strings
+    to skip the filtering pass.
     """
-    items = [i for i in (items or []) if i]
-    if not items:
+    if not (prefiltered and items):
+        items = [i for i in items or () if i]
+    n = len(items)
+    if n == 0:
         return "TBD"
-    if len(items) == 1:
+    if n == 1:
         return items[0]
-    return ", ".join(items[:-1]) + f" and {items[-1]}"
+    if n == 2:
+        return items[0] + " and " + items[1]
+    return ", ".join(items[:-1]) + " and " + items[-1]
 
 
 def md_line(text: str) -> str:
@@ -16,6 +25,18 @@ def md_line(text: str) -> str:
     return f"- {text}" if text else ""
 
 
+# "TBD" as a standalone word, so words that merely contain it still count
+_TBD_RE = re.compile(r"\btbd\b")
+
+# Default sentences (lower-cased) that is_meaningful treats as placeholders
+_PLACEHOLDERS = frozenset(
+    {
+        "no additional gating logic beyond the defined go/no-go criteria.",
+        "this solution will not employ a distinct orchestration layer.",
+    }
+)
+
+
 def is_meaningful(text: str) -> bool:
     """
     Determine if a sentence contains meaningful content (not placeholders/TBD).
@@ -23,10 +44,4 @@ def is_meaningful(text: str) -> bool:
     if not text:
         return False
     t = text.strip().lower()
-    if not t or "tbd" in t:
-        return False
-    default_placeholders = {
-        "no additional gating logic beyond the defined go/no-go criteria.",
-        "this solution will not employ a distinct orchestration layer.",
-    }
-    return t not in default_placeholders
+    return bool(t) and not _TBD_RE.search(t) and t not in _PLACEHOLDERS